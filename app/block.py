@@ -18,6 +18,8 @@ class Block:
         self.height = height
         self.timestamp = timestamp
         self.transactions = transactions
+        # Number of transfer transactions (excludes heartbeats and registrations), shown by the explorer
+        self.transfer_count = sum(1 for tx in transactions if tx.tx_type == "transfer")
         self.previous_hash = previous_hash
         self.proposer = proposer
         self.reward = reward
@@ -2,30 +2,66 @@ import sys
 import os
 import uvicorn
 import asyncio
+import bisect
 import aiohttp
 import argparse
-from contextlib import asynccontextmanager
+import glob
+import gzip
+import hashlib
+import jinja2
+import multiprocessing
+import re
+import threading
+import uuid
+from contextlib import asynccontextmanager, suppress
+from decimal import Decimal, InvalidOperation
+from operator import itemgetter
 from fastapi import FastAPI, HTTPException, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from markupsafe import Markup
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from app.ledger import Ledger
 from app.transaction import Transaction
 from app.wallet import Wallet
+from app.seed_wallet import SeedWallet
+from app.metawallet import MultiWallet
+from app.wallet_index import WALLET_INDEX_FILE, lookup_wallet
 from app.explorer_assets import (
-    get_base_styles, get_chart_js_cdn, get_vis_js_cdn,
-    get_theme_toggle_script, get_live_updates_script, get_navigation_html
+    BASE_STYLES, CDN_PRECONNECT, CHART_JS_CDN, VIS_JS_CDN, THEME_TOGGLE_SCRIPT, LIVE_UPDATES_SCRIPT,
+    NAV_HTML, NAV_HTML_NO_ACTIVE, SEND_STYLES, STATIC_ASSETS
 )
 import app.config_testnet as config
 import time
 import json
 
+try:
+    import orjson  # optional: faster JSON for the explorer <-> node API exchange
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # optional: smaller precompressed /assets responses
+except ImportError:
+    brotli = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when it is installed (Starlette's compact json otherwise)"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
 limiter = Limiter(key_func=get_remote_address)
-app = FastAPI(title="TIMPAL Block Explorer", version="1.0.0")
+app = FastAPI(title="TIMPAL Block Explorer", version="1.0.0", default_response_class=FastJSONResponse)
 app.state.limiter = limiter
 
 # Mount static files directory
@@ -50,6 +86,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Local node HTTP API used for account lookups and transaction submission.
+# 127.0.0.1 rather than localhost: no resolver lookup and no ::1 attempt first
+# (the node API listens on 0.0.0.0).
+NODE_API_PORT = os.getenv("EXPLORER_API_PORT", "9001")
+NODE_BASE_URL = f"http://127.0.0.1:{NODE_API_PORT}"
+
+# /stream: one watcher task polls for a new chain tip every STREAM_POLL_INTERVAL seconds
+# and wakes all SSE clients (FastAPI pings idle connections every 15 seconds)
+STREAM_POLL_INTERVAL = 2
+
+# The startup integrity check runs in a child process; the lifespan checks on it this often
+STARTUP_VERIFY_POLL_INTERVAL = 0.5
+
+# Signed transfers are queued by POST /send (which answers 202) and broadcast by a
+# background flusher; outcomes are kept for TX_STATUS_TTL seconds for /tx_status polling
+SUBMIT_BATCH_SIZE = 50
+TX_STATUS_TTL = 600
+_tx_status: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# sender -> (nonce, signed_at) of the last transfer signed here; the node's pending
+# nonce cannot include a transfer that is still waiting in the broadcast queue
+_last_signed_nonce: Dict[str, Tuple[int, float]] = {}
+
 _ledger_cache = None
 _ledger_cache_time = 0
 CACHE_TTL = 5
@@ -60,6 +118,62 @@ _stats_cache_height = -1
 _validator_stats_cache: Dict[str, Any] = {}
 _validator_stats_cache_height = -1
 
+# Chain-derived /debug/* payloads: name -> (chain tip, payload)
+_debug_cache: Dict[str, Tuple[Tuple[int, str], Dict[str, Any]]] = {}
+
+# /network draws proposer-sequence edges from this many most recent blocks only
+NETWORK_EDGE_BLOCKS = 1000
+
+# Validators that proposed a block within this many blocks are shown as online
+# (~90 seconds at 3s/block - proof of activity window)
+LIVENESS_WINDOW = 30
+
+# Final /stats and /validators payloads, returned verbatim until the chain tip
+# (block count + tip hash) changes; every client shares one computation per block
+_stats_response: Dict[str, Any] = {}
+_stats_response_tip: Optional[Tuple[int, str]] = None
+_validators_response: Dict[str, Any] = {}
+_validators_response_tip: Optional[Tuple[int, str]] = None
+
+# Rendered /analytics and /network pages and /api/validators-dashboard.json body: endpoint -> (chain tip, body).
+# Only the body for the current tip is ever served, so one entry per endpoint suffices.
+_page_cache: Dict[str, Tuple[Tuple[int, str], Any]] = {}
+
+# TIMPAL address: "tmpl" + first 44 hex chars of double-SHA256(public key)
+_ADDRESS_RE = re.compile(r"tmpl[0-9a-f]{44}")
+# Block and transaction hashes: SHA-256 hex digests
+_HASH_RE = re.compile(r"[0-9a-f]{64}")
+
+# Rendered /blocks/{height} pages keyed by (block_hash, has_next_block).
+# Blocks without transfers dominate on a quiet chain and render to a much
+# smaller page, so they get their own larger pool and cannot evict the
+# pages of blocks that do carry transfers.
+_block_page_cache: Dict[Tuple[str, bool], str] = {}
+BLOCK_PAGE_CACHE_SIZE = 256
+_empty_block_page_cache: Dict[Tuple[str, bool], str] = {}
+EMPTY_BLOCK_PAGE_CACHE_SIZE = 1024
+_CONFIRMATIONS_PLACEHOLDER = "<!--confirmations-->"
+
+# Encoded /api/blocks/range entries keyed by block hash. A block's JSON never
+# changes, so it is encoded once and reused across ledger reloads for every
+# sync peer requesting a range that contains it. Ranges are encoded on worker
+# threads, so lookups and inserts hold _block_json_lock.
+_block_json_cache: Dict[str, bytes] = {}
+_block_json_lock = threading.Lock()
+BLOCK_JSON_CACHE_SIZE = 4096
+
+# Local wallet files: path -> (mtime, wallet version, addresses it can sign for).
+# Addresses are stored in clear in the wallet JSON, so a file is only re-parsed
+# when its mtime changes.
+_WALLET_INDEX: Dict[str, Tuple[float, int, set]] = {}
+
+# Where /send looks for wallets: wallet*.json (wallets.json, wallet_v2.json,
+# wallet.json) in TIMPAL_WALLET_DIR, the directory the wallet CLI writes to by
+# default. TIMPAL_WALLET_GLOB overrides this with an explicit pattern; it is
+# never expanded recursively.
+WALLET_DIR = os.getenv("TIMPAL_WALLET_DIR", ".")
+WALLET_GLOB = os.getenv("TIMPAL_WALLET_GLOB") or os.path.join(WALLET_DIR, "wallet*.json")
+
 
 def get_cached_validator_stats(ledger: Ledger) -> Dict[str, Dict[str, Any]]:
     """
@@ -71,7 +185,7 @@ def get_cached_validator_stats(ledger: Ledger) -> Dict[str, Dict[str, Any]]:
     """
     global _validator_stats_cache, _validator_stats_cache_height
     
-    current_height = ledger.get_block_count() - 1
+    current_height = ledger.head_height
     
     if current_height != _validator_stats_cache_height or not _validator_stats_cache:
         validator_stats: Dict[str, Dict[str, Any]] = {}
@@ -104,6 +218,28 @@ def get_cached_validator_stats(ledger: Ledger) -> Dict[str, Dict[str, Any]]:
     return _validator_stats_cache
 
 
+def _device_id_preview(info: Dict[str, Any]) -> Optional[str]:
+    """Validator device ID for tables, shortened to 32 characters ('N/A' when not recorded)"""
+    device_id = info.get('device_id', 'N/A')
+    if device_id and len(device_id) > 32:
+        return device_id[:32] + '...'
+    return device_id
+
+
+def get_display_status(last_block_height: int, current_height: int) -> str:
+    """
+    Real-time validator status shown by the leaderboard, /validators and /network.
+    
+    During bootstrap (first 10 blocks) every registered validator is "active";
+    afterwards only validators that proposed a block within LIVENESS_WINDOW blocks.
+    """
+    if current_height < 10:
+        return "active"
+    if last_block_height >= 0 and (current_height - last_block_height) <= LIVENESS_WINDOW:
+        return "active"
+    return "offline"
+
+
 def get_cached_stats(ledger: Ledger) -> Dict[str, Any]:
     """
     Get cached blockchain statistics with height-based invalidation.
@@ -114,7 +250,7 @@ def get_cached_stats(ledger: Ledger) -> Dict[str, Any]:
     """
     global _stats_cache, _stats_cache_height
     
-    current_height = ledger.get_block_count() - 1
+    current_height = ledger.head_height
     
     if current_height != _stats_cache_height or not _stats_cache:
         transfer_count = 0
@@ -159,48 +295,330 @@ def get_cached_stats(ledger: Ledger) -> Dict[str, Any]:
     return _stats_cache
 
 
-def get_ledger() -> Ledger:
-    """Get ledger instance with 5-second caching for performance"""
-    global _ledger_cache, _ledger_cache_time
+def json_dumps(obj: Any) -> bytes:
+    """Encode a node API request or JSON response body (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode a node API response body (orjson when installed, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def get_chain_tip(ledger: Ledger) -> Tuple[int, str]:
+    """Identify the current chain tip (block count, tip hash) for tip-keyed caches"""
+    latest_block = ledger.get_latest_block()
+    return len(ledger.blocks), latest_block.block_hash if latest_block else ""
+
+
+def create_node_session() -> aiohttp.ClientSession:
+    """Create the keep-alive HTTP session used for all explorer -> node API calls"""
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, keepalive_timeout=60)
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_node_session(request: Request) -> aiohttp.ClientSession:
+    """Get the app-lifetime node API session (created lazily if lifespan did not run)"""
+    return _app_node_session(request.app)
+
+
+def _app_node_session(fastapi_app: FastAPI) -> aiohttp.ClientSession:
+    session = getattr(fastapi_app.state, "http", None)
+    if session is None or session.closed:
+        session = create_node_session()
+        fastapi_app.state.http = session
+    return session
+
+
+def get_submit_queue(fastapi_app: FastAPI) -> asyncio.Queue:
+    """Get the transfer broadcast queue, (re)starting its flusher task if needed"""
+    queue = getattr(fastapi_app.state, "submit_q", None)
+    if queue is None:
+        queue = asyncio.Queue()
+        fastapi_app.state.submit_q = queue
+    flusher = getattr(fastapi_app.state, "submit_flusher", None)
+    if flusher is None or flusher.done():
+        fastapi_app.state.submit_flusher = asyncio.create_task(_submit_flusher(fastapi_app))
+    return queue
+
+
+async def _submit_flusher(fastapi_app: FastAPI):
+    """
+    Broadcast queued transfers to the node.
     
-    # Auto-detect local node data directory or use environment variable
-    import os
-    import glob
+    Waits for the first queued transfer, then takes whatever else is already
+    waiting (up to SUBMIT_BATCH_SIZE) and sends them in one batch request, so
+    bursts share a round-trip while a lone transfer is not held back.
+    """
+    queue = fastapi_app.state.submit_q
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < SUBMIT_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        await _broadcast_batch(_app_node_session(fastapi_app), batch)
+
+
+async def _broadcast_batch(session: aiohttp.ClientSession, batch: List[Tuple[str, Dict[str, Any]]]):
+    """POST a batch of signed transactions to the node and record each outcome in _tx_status"""
+    try:
+        payload = json_dumps([tx for _, tx in batch])
+        async with session.post(f"{NODE_BASE_URL}/submit_transactions_batch", data=payload, headers=_JSON_HEADERS) as resp:
+            if resp.status == 200:
+                results = json_loads(await resp.read())['results']
+            else:
+                error_text = await resp.text()
+                results = [{"status": "error", "message": error_text}] * len(batch)
+    except Exception as e:
+        results = [{"status": "error", "message": f"Node unreachable: {e}"}] * len(batch)
+    
+    # Every queued transfer gets an outcome: results the node left out or sent malformed are errors
+    if not isinstance(results, list):
+        results = []
+    missing = {"status": "error", "message": "No result returned by node"}
+    results = results[:len(batch)] + [missing] * (len(batch) - len(results))
+    
+    now = time.time()
+    for (client_id, tx), result in zip(batch, results):
+        if not isinstance(result, dict):
+            result = {"status": "error", "message": "Malformed result returned by node"}
+        if result.get('status') == 'success':
+            status = {"status": "success", "message": "Transaction broadcast to network!", "tx_hash": tx['tx_hash']}
+        else:
+            status = {"status": "error", "error": f"Node rejected transaction: {result.get('message')}", "tx_hash": tx['tx_hash']}
+            # The nonce was not consumed: forget the sender's signed nonces from it up, so the
+            # next transfer is signed with the node's nonce again instead of leaving a gap
+            tracked = _last_signed_nonce.get(tx['sender'])
+            if tracked is not None and tx['nonce'] <= tracked[0]:
+                del _last_signed_nonce[tx['sender']]
+        _tx_status[client_id] = (now, status)
+    
+    for client_id in [cid for cid, (ts, _) in _tx_status.items() if now - ts > TX_STATUS_TTL]:
+        del _tx_status[client_id]
+    for sender in [addr for addr, (_, ts) in _last_signed_nonce.items() if now - ts > TX_STATUS_TTL]:
+        del _last_signed_nonce[sender]
+
+
+def get_stream_condition(fastapi_app: FastAPI) -> asyncio.Condition:
+    """Get the /stream new-block condition, (re)starting its watcher task if needed"""
+    condition = getattr(fastapi_app.state, "stream_cond", None)
+    if condition is None:
+        condition = asyncio.Condition()
+        fastapi_app.state.stream_cond = condition
+        fastapi_app.state.stream_event = None
+    watcher = getattr(fastapi_app.state, "stream_watcher", None)
+    if watcher is None or watcher.done():
+        fastapi_app.state.stream_watcher = asyncio.create_task(_stream_watcher(fastapi_app))
+    return condition
+
+
+async def _stream_watcher(fastapi_app: FastAPI):
+    """
+    Watch the chain tip on behalf of every /stream client.
     
+    When the height changes the event is built and serialized once, stored as
+    app.state.stream_event and all waiting clients are notified, so the number
+    of connected clients no longer multiplies the polling or encoding work:
+    every client yields the same ServerSentEvent object.
+    """
+    condition = fastapi_app.state.stream_cond
+    last_height = 0
+    while True:
+        try:
+            ledger = get_ledger()
+            latest_block = ledger.get_latest_block()
+            current_height = latest_block.height if latest_block else 0
+            
+            if current_height != last_height:
+                last_height = current_height
+                cached = get_cached_stats(ledger)
+                
+                data = {
+                    "latest_block": current_height,
+                    "total_supply_tmpl": format_pals(ledger.total_emitted_pals),
+                    "validator_count": ledger.get_validator_count(),
+                    "total_transactions": cached['transfer_count'],
+                    "timestamp": time.time()
+                }
+                
+                async with condition:
+                    fastapi_app.state.stream_event = ServerSentEvent(raw_data=json_dumps(data).decode())
+                    condition.notify_all()
+        except Exception as e:
+            print(f"SSE Error: {e}")
+        
+        await asyncio.sleep(STREAM_POLL_INTERVAL)
+
+
+def _find_data_dir() -> str:
+    """
+    Locate the ledger directory to read: EXPLORER_DATA_DIR if set, otherwise the most
+    recently modified testnet_data_node_*/ledger (new default location ~/.timpal/ first,
+    then the legacy project directory), falling back to the VPS genesis node's directory.
+    """
     data_dir = os.getenv("EXPLORER_DATA_DIR")
+    if data_dir:
+        return data_dir
     
-    if not data_dir:
-        # Auto-detect: find any testnet_data_node_* directory with blockchain data
-        # Check both the new default location (~/.timpal/) and legacy location (project dir)
-        from pathlib import Path
-        
-        node_dirs = []
-        
-        # Check new default location: ~/.timpal/testnet_data_node_*/ledger
-        timpal_home = Path.home() / ".timpal"
-        if timpal_home.exists():
-            node_dirs.extend(glob.glob(str(timpal_home / "testnet_data_node_*/ledger")))
-        
-        # Also check legacy location: ./testnet_data_node_*/ledger (for backwards compatibility)
-        node_dirs.extend(glob.glob("testnet_data_node_*/ledger"))
-        
-        if node_dirs:
-            # Prefer the most recently modified directory (active node)
-            data_dir = sorted(node_dirs, key=lambda x: os.path.getmtime(x), reverse=True)[0]
-            print(f"📊 Explorer auto-detected blockchain data: {data_dir}")
-        else:
-            # Fallback to new default location (VPS genesis node)
-            data_dir = str(Path.home() / ".timpal" / "testnet_data_node_9000" / "ledger")
-            print(f"⚠️  No blockchain data found, using default: {data_dir}")
+    timpal_home = os.path.join(os.path.expanduser("~"), ".timpal")
+    candidates = []
+    for base in (timpal_home, ""):
+        try:
+            entries = os.scandir(base or ".")
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.startswith("testnet_data_node_"):
+                    continue
+                ledger_dir = os.path.join(base, entry.name, "ledger")
+                try:
+                    candidates.append((os.stat(ledger_dir).st_mtime, ledger_dir))
+                except OSError:
+                    continue
+    
+    if candidates:
+        # Prefer the most recently modified directory (active node)
+        data_dir = max(candidates)[1]
+        print(f"📊 Explorer auto-detected blockchain data: {data_dir}")
+    else:
+        # Fallback to new default location (VPS genesis node)
+        data_dir = os.path.join(timpal_home, "testnet_data_node_9000", "ledger")
+        print(f"⚠️  No blockchain data found, using default: {data_dir}")
+    return data_dir
+
+
+def get_ledger() -> Ledger:
+    """Get ledger instance with 5-second caching for performance"""
+    global _ledger_cache, _ledger_cache_time
     
     current_time = time.time()
     if _ledger_cache is None or (current_time - _ledger_cache_time) > CACHE_TTL:
-        _ledger_cache = Ledger(data_dir=data_dir, use_production_storage=True, read_only=True)
+        _ledger_cache = Ledger(data_dir=_find_data_dir(), use_production_storage=True, read_only=True)
         _ledger_cache_time = current_time
     
     return _ledger_cache
 
 
+def _minify_html(html: str) -> str:
+    """Strip template indentation and blank lines from a static HTML body.
+    
+    Line breaks are kept so inline JavaScript relying on them stays valid.
+    """
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def _make_etag(body: str) -> str:
+    """Strong ETag derived from the body content"""
+    return '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match names this ETag (any entry of the list, weak or strong, or *)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header == etag:
+        return True
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag or tag == "*":
+            return True
+    return False
+
+
+def _accepts_encoding(request: Request, coding: str) -> bool:
+    """Whether Accept-Encoding allows a content coding (listed or matched by *, with q > 0)"""
+    wildcard = False
+    for entry in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = entry.partition(";")
+        name = name.strip().lower()
+        if name not in (coding, "*"):
+            continue
+        quality = 1.0
+        param, _, value = params.partition("=")
+        if param.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if name == coding:
+            return quality > 0
+        wildcard = quality > 0
+    return wildcard
+
+
+def precompressed_response(request: Request, body: str, body_gz: bytes, etag: str,
+                           media_type: str = "text/html", body_br: Optional[bytes] = None) -> Response:
+    """Serve a prebuilt page, stylesheet or script body in the best encoding the client accepts.
+    
+    Each encoding is a different representation, so compressed responses carry the
+    ETag with a "-br"/"-gz" suffix and only revalidate against their own encoding.
+    
+    Args:
+        request: Incoming request (checked for If-None-Match / Accept-Encoding)
+        body: Uncompressed body
+        body_gz: The same body gzipped once at import time
+        etag: ETag of the uncompressed body
+        media_type: Content type of the body
+        body_br: The same body brotli-compressed at import time (None if brotli is unavailable)
+    
+    Returns:
+        304 when the client copy is current, otherwise the (compressed) body
+    """
+    if body_br is not None and _accepts_encoding(request, "br"):
+        content, encoding = body_br, "br"
+    elif _accepts_encoding(request, "gzip"):
+        content, encoding = body_gz, "gzip"
+    else:
+        content, encoding = body, None
+    
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["ETag"] = etag[:-1] + ("-br" if encoding == "br" else "-gz") + '"'
+        headers["Content-Encoding"] = encoding
+    else:
+        headers["ETag"] = etag
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers={"ETag": headers["ETag"], "Vary": "Accept-Encoding"})
+    return Response(content, media_type=media_type, headers=headers)
+
+
+# Explorer stylesheet and scripts (explorer_assets.STATIC_ASSETS), compressed and tagged once
+# at import: name -> (body, gzipped body, brotli body or None, ETag, media type). Pages link
+# them with a content-hash ?v= parameter, so responses may be cached indefinitely.
+_ASSETS = {
+    name: (
+        body,
+        gzip.compress(body.encode(), compresslevel=9, mtime=0),
+        brotli.compress(body.encode(), quality=11) if brotli is not None else None,
+        _make_etag(body),
+        media_type,
+    )
+    for name, (body, media_type) in STATIC_ASSETS.items()
+}
+
+
+@app.get("/assets/{name}")
+async def static_asset(request: Request, name: str):
+    """Serve an explorer stylesheet or script"""
+    asset = _ASSETS.get(name)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    body, body_gz, body_br, etag, media_type = asset
+    response = precompressed_response(request, body, body_gz, etag, media_type, body_br)
+    response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
 def format_pals(pals: int) -> str:
     """Convert pals to TMPL format (1 TMPL = 100,000,000 pals)"""
     tmpl = pals / config.PALS_PER_TMPL
@@ -321,11 +739,91 @@ def get_all_transactions(ledger: Ledger, page: int = 1, page_size: int = 50, tx_
     }
 
 
-def get_address_transactions(ledger: Ledger, address: str) -> List[Dict[str, Any]]:
-    """Get all transfer transactions involving an address (excludes heartbeats and registrations)"""
+def get_transactions_page_and_stats(ledger: Ledger, *, page: int = 1, page_size: int = 50, tx_filter: Optional[str] = None, hide_legacy: bool = True) -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """Get transaction stats and one page of transactions in a single chain walk
+    
+    Equivalent to calling get_transaction_stats() followed by get_all_transactions(),
+    but both results are produced by the same pass over the blocks (newest first).
+    
+    Args:
+        ledger: Ledger instance
+        page: Page number (1-indexed)
+        page_size: Number of transactions per page (max 100)
+        tx_filter: Filter by transaction type (None = all types)
+        hide_legacy: Hide legacy validator_heartbeat transactions
+    
+    Returns:
+        Tuple of (stats, result) in the formats of get_transaction_stats() and get_all_transactions()
+    """
+    page_size = min(page_size, 100)
+    
+    stats = {
+        'total': 0,
+        'transfer': 0,
+        'validator_registration': 0,
+        'validator_heartbeat': 0,
+        'epoch_attestation': 0,
+        'genesis_reward': 0
+    }
+    
+    requested_page = max(1, page)
+    skip_count = (requested_page - 1) * page_size
+    total_count = 0
+    page_txs = []
+    
+    for block in reversed(ledger.blocks):
+        for tx in block.transactions:
+            tx_type = tx.tx_type
+            if tx_type in stats:
+                stats[tx_type] += 1
+            
+            # Skip legacy heartbeats if requested
+            if hide_legacy and tx_type == 'validator_heartbeat':
+                continue
+            stats['total'] += 1
+            
+            # Apply filter if specified
+            if tx_filter and tx_type != tx_filter:
+                continue
+            
+            # Collect only the transactions that fall on the requested page
+            if skip_count <= total_count < skip_count + page_size:
+                tx_data = tx.to_dict()
+                tx_data['block_height'] = block.height
+                tx_data['block_hash'] = block.block_hash
+                tx_data['timestamp'] = block.timestamp
+                page_txs.append(tx_data)
+            total_count += 1
+    
+    total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
+    page = min(requested_page, total_pages)
+    
+    if page != requested_page:
+        # Requested page is past the end - fall back to the last page
+        return stats, get_all_transactions(ledger, page=page, page_size=page_size, tx_filter=tx_filter, hide_legacy=hide_legacy)
+    
+    return stats, {
+        'transactions': page_txs,
+        'page': page,
+        'page_size': page_size,
+        'total_count': total_count,
+        'total_pages': total_pages,
+        'has_next': page < total_pages,
+        'has_prev': page > 1
+    }
+
+
+def get_address_transactions(ledger: Ledger, address: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Get transfer transactions involving an address (excludes heartbeats and registrations)
+    
+    With a limit, blocks are walked from the tip and the scan stops once enough
+    transactions were found, so only the latest `limit` are returned.
+    """
     transactions = []
+    blocks = reversed(ledger.blocks) if limit is not None else ledger.blocks
     
-    for block in ledger.blocks:
+    for block in blocks:
         for tx in block.transactions:
             # Only include transfer transactions (exclude heartbeats and registrations)
             if (tx.sender == address or tx.recipient == address) and tx.tx_type == "transfer":
@@ -334,8 +832,10 @@ def get_address_transactions(ledger: Ledger, address: str) -> List[Dict[str, Any
                 tx_data['block_hash'] = block.block_hash
                 tx_data['timestamp'] = block.timestamp
                 transactions.append(tx_data)
+        if limit is not None and len(transactions) >= limit:
+            break
     
-    return sorted(transactions, key=lambda x: x['timestamp'], reverse=True)
+    return sorted(transactions, key=itemgetter('timestamp'), reverse=True)[:limit]
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -352,20 +852,20 @@ async def root(request: Request):
     transfer_count = tx_stats['transfer']
     
     # Get configured API port for display
-    import os
-    node_api_port = os.getenv("EXPLORER_API_PORT", "9001")
+    node_api_port = NODE_API_PORT
     
     html = f"""
     <!DOCTYPE html>
     <html>
     <head>
+        <meta charset="UTF-8">
         <meta http-equiv="Cache-Control" content="no-cache, no-store, must-revalidate">
         <meta http-equiv="Pragma" content="no-cache">
         <meta http-equiv="Expires" content="0">
         <title>TIMPAL Block Explorer</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
-        {get_live_updates_script()}
+        {BASE_STYLES}
+        {THEME_TOGGLE_SCRIPT}
+        {LIVE_UPDATES_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
@@ -382,7 +882,7 @@ async def root(request: Request):
             </div>
         </div>
         
-        {get_navigation_html("home")}
+        {NAV_HTML["home"]}
         
         <div class="stats">
             <div class="stat-card">
@@ -420,7 +920,7 @@ async def root(request: Request):
                 />
                 <button 
                     type="submit" 
-                    style="padding: 12px 30px; background: linear-gradient(135deg, var(--gradient-start), var(--gradient-end)); color: white; border: none; border-radius: 5px; font-weight: bold; cursor: pointer; font-size: 1em;"
+                    style="padding: 12px 30px; background: var(--brand-gradient); color: white; border: none; border-radius: 5px; font-weight: bold; cursor: pointer; font-size: 1em;"
                 >
                     Search
                 </button>
@@ -437,7 +937,7 @@ async def root(request: Request):
             <div class="card">
                 <h2>🚀 Quick Actions</h2>
                 <div style="display: grid; gap: 10px;">
-                    <a href="/validators-dashboard" style="display: block; padding: 15px; background: linear-gradient(135deg, var(--gradient-start), var(--gradient-end)); color: white; border-radius: 5px; text-align: center; font-weight: bold;">
+                    <a href="/validators-dashboard" style="display: block; padding: 15px; background: var(--brand-gradient); color: white; border-radius: 5px; text-align: center; font-weight: bold;">
                         🛡️ View Validator Dashboard
                     </a>
                     <a href="/analytics" style="display: block; padding: 15px; background: linear-gradient(135deg, #10b981, #059669); color: white; border-radius: 5px; text-align: center; font-weight: bold;">
@@ -568,7 +1068,7 @@ async def get_blocks(request: Request, limit: int = 50, offset: int = 0):
     for block in reversed(blocks):
         timestamp_str = datetime.fromtimestamp(block.timestamp).strftime('%Y-%m-%d %H:%M:%S')
         # Count only transfer transactions (exclude heartbeats and registrations)
-        transfer_count = sum(1 for tx in block.transactions if tx.tx_type == "transfer")
+        transfer_count = block.transfer_count
         
         # Calculate total reward distributed (base + transaction fees)
         total_distributed = sum(block.reward_allocations.values()) if block.reward_allocations else block.reward
@@ -605,12 +1105,12 @@ async def get_blocks(request: Request, limit: int = 50, offset: int = 0):
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Recent Blocks - TIMPAL Explorer</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
+        {BASE_STYLES}
+        {THEME_TOGGLE_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
-        {get_navigation_html("blocks")}
+        {NAV_HTML["blocks"]}
         
         <div class="card">
             <h1>📦 Recent Blocks</h1>
@@ -655,21 +1155,18 @@ async def get_blocks(request: Request, limit: int = 50, offset: int = 0):
     return HTMLResponse(content=html)
 
 
-@app.get("/blocks/{height}", response_class=HTMLResponse)
-@limiter.limit("20/minute")
-async def get_block_by_height(request: Request, height: int):
-    """Get specific block details page"""
-    from datetime import datetime
-    ledger = get_ledger()
-    block = ledger.get_block_by_height(height)
+def _render_block_page(block, has_next: bool) -> str:
+    """Render the block details page with a placeholder for the confirmation count
     
-    if not block:
-        raise HTTPException(status_code=404, detail="Block not found")
+    Everything else on the page is fixed once the block exists, so the result
+    can be cached and only the confirmations substituted per request.
+    """
+    from datetime import datetime
+    height = block.height
     
     # Filter to show only TMPL transfer transactions (exclude heartbeats and registrations)
     transactions = [tx.to_dict() for tx in block.transactions if tx.tx_type == "transfer"]
     timestamp_str = datetime.fromtimestamp(block.timestamp).strftime('%Y-%m-%d %H:%M:%S UTC')
-    confirmations = len(ledger.blocks) - block.height
     
     # Calculate total fees in this block (only from transfer transactions)
     total_fees = sum(tx.get('fee', 0) for tx in transactions)
@@ -721,12 +1218,12 @@ async def get_block_by_height(request: Request, height: int):
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Block #{height} - TIMPAL Explorer</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
+        {BASE_STYLES}
+        {THEME_TOGGLE_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
-        {get_navigation_html("blocks")}
+        {NAV_HTML["blocks"]}
         
         <div class="card">
             <h1>📦 Block #{height}</h1>
@@ -745,7 +1242,7 @@ async def get_block_by_height(request: Request, height: int):
                     </tr>
                     <tr>
                         <td><strong>Status</strong></td>
-                        <td><span class="badge badge-success">✅ Confirmed</span> ({confirmations} confirmations)</td>
+                        <td><span class="badge badge-success">✅ Confirmed</span> ({_CONFIRMATIONS_PLACEHOLDER} confirmations)</td>
                     </tr>
                     <tr>
                         <td><strong>Timestamp</strong></td>
@@ -824,22 +1321,110 @@ async def get_block_by_height(request: Request, height: int):
             <div style="display: flex; gap: 10px; justify-content: center;">
                 {f'<a href="/blocks/{block.height - 1}" style="padding: 10px 20px; background: var(--gradient-start); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">← Previous Block</a>' if block.height > 0 else ''}
                 <a href="/" style="padding: 10px 20px; background: var(--text-secondary); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">🏠 Home</a>
-                {f'<a href="/blocks/{block.height + 1}" style="padding: 10px 20px; background: var(--gradient-start); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">Next Block →</a>' if block.height < len(ledger.blocks) - 1 else ''}
+                {f'<a href="/blocks/{block.height + 1}" style="padding: 10px 20px; background: var(--gradient-start); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">Next Block →</a>' if has_next else ''}
             </div>
         </div>
     </body>
     </html>
     """
     
-    return HTMLResponse(content=html)
+    return html
+
+
+@app.get("/blocks/{height}", response_class=HTMLResponse)
+@limiter.limit("20/minute")
+async def get_block_by_height(request: Request, height: int):
+    """Get specific block details page"""
+    ledger = get_ledger()
+    block = ledger.get_block_by_height(height)
+    
+    if not block:
+        raise HTTPException(status_code=404, detail="Block not found")
+    
+    if block.transfer_count:
+        cache, cache_size = _block_page_cache, BLOCK_PAGE_CACHE_SIZE
+    else:
+        cache, cache_size = _empty_block_page_cache, EMPTY_BLOCK_PAGE_CACHE_SIZE
+    
+    # Key on the hash so a reorg at this height never serves a stale page
+    has_next = block.height < ledger.head_height
+    cache_key = (block.block_hash, has_next)
+    html = cache.get(cache_key)
+    if html is None:
+        html = _render_block_page(block, has_next)
+        if len(cache) >= cache_size:
+            cache.pop(next(iter(cache)))
+        cache[cache_key] = html
+    
+    confirmations = ledger.head_height - block.height + 1
+    return HTMLResponse(content=html.replace(_CONFIRMATIONS_PLACEHOLDER, str(confirmations), 1))
+
+
+_TX_TYPE_BADGES = {
+    'transfer': '<span class="badge badge-success">Transfer</span>',
+    'validator_registration': '<span class="badge badge-info">Registration</span>',
+    'epoch_attestation': '<span class="badge badge-warning">Epoch Attestation</span>',
+    'validator_heartbeat': '<span class="badge badge-secondary">Heartbeat (Legacy)</span>',
+    'genesis_reward': '<span class="badge badge-info">Genesis Reward</span>'
+}
+
+
+def _render_tx_row(tx: Dict[str, Any]) -> str:
+    """Render one /transactions table row with type-specific formatting"""
+    from datetime import datetime
+    timestamp_str = datetime.fromtimestamp(tx['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Type badge with color coding
+    type_badge = _TX_TYPE_BADGES.get(tx['tx_type'], f'<span class="badge badge-secondary">{tx["tx_type"]}</span>')
+    
+    # Format sender and recipient based on transaction type
+    sender = tx.get('sender', 'N/A')
+    recipient = tx.get('recipient', 'N/A')
+    
+    sender_display = f'<a href="/address/{sender}" style="font-family: monospace; font-size: 0.85em;">{sender[:12]}...</a>' if sender != 'N/A' else sender
+    recipient_display = f'<a href="/address/{recipient}" style="font-family: monospace; font-size: 0.85em;">{recipient[:12]}...</a>' if recipient != 'N/A' else recipient
+    
+    # Format amount and fee based on type
+    if tx['tx_type'] == 'epoch_attestation':
+        # For epoch attestations, show epoch number instead of amount
+        amount_display = f'Epoch {tx.get("epoch_number", "N/A")}'
+        fee_display = format_pals(tx.get('fee', 0))
+    else:
+        amount_display = format_pals(tx.get('amount', 0))
+        fee_display = format_pals(tx.get('fee', 0))
+    
+    return f"""
+            <tr>
+                <td><a href="/tx/{tx['tx_hash']}" style="font-family: monospace; font-size: 0.85em;">{tx['tx_hash'][:16]}...</a></td>
+                <td>{type_badge}</td>
+                <td>{sender_display}</td>
+                <td>{recipient_display}</td>
+                <td>{amount_display}</td>
+                <td>{fee_display}</td>
+                <td><a href="/blocks/{tx['block_height']}">#{tx['block_height']}</a></td>
+                <td style="font-size: 0.85em;">{timestamp_str}</td>
+            </tr>
+        """
+
+
+async def _stream_tx_page(head: str, transactions: List[Dict[str, Any]], empty_row: str, footer: str):
+    """Yield the /transactions page in chunks: head and stats first, then one row at a time"""
+    yield head
+    if not transactions:
+        yield empty_row
+    for tx in transactions:
+        yield _render_tx_row(tx)
+    yield footer
 
 
 @app.get("/transactions", response_class=HTMLResponse)
 @limiter.limit("20/minute")
 async def get_transactions(request: Request, page: int = 1, tx_filter: Optional[str] = None, hide_legacy: str = "true"):
-    """Get paginated list of all transactions with filtering (defaults to transfers only)"""
-    from datetime import datetime
+    """Get paginated list of all transactions with filtering (defaults to transfers only)
     
+    The page is streamed: the head, navigation and stats go out before the
+    table rows are rendered so the browser can start laying out the page.
+    """
     ledger = get_ledger()
     
     # Parse hide_legacy parameter
@@ -849,11 +1434,9 @@ async def get_transactions(request: Request, page: int = 1, tx_filter: Optional[
     if tx_filter is None:
         tx_filter = "transfer"
     
-    # Get transaction statistics matching the hide_legacy filter
-    tx_stats = get_transaction_stats(ledger, hide_legacy=hide_legacy_bool)
-    
-    # Get paginated transactions
-    result = get_all_transactions(
+    # Get transaction statistics (matching the hide_legacy filter) and the
+    # paginated transactions from a single pass over the chain
+    tx_stats, result = get_transactions_page_and_stats(
         ledger, 
         page=page, 
         page_size=50, 
@@ -861,50 +1444,6 @@ async def get_transactions(request: Request, page: int = 1, tx_filter: Optional[
         hide_legacy=hide_legacy_bool
     )
     
-    # Build transaction rows with type-specific formatting
-    tx_rows = ""
-    for tx in result['transactions']:
-        timestamp_str = datetime.fromtimestamp(tx['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Type badge with color coding
-        type_badges = {
-            'transfer': '<span class="badge badge-success">Transfer</span>',
-            'validator_registration': '<span class="badge badge-info">Registration</span>',
-            'epoch_attestation': '<span class="badge badge-warning">Epoch Attestation</span>',
-            'validator_heartbeat': '<span class="badge badge-secondary">Heartbeat (Legacy)</span>',
-            'genesis_reward': '<span class="badge badge-info">Genesis Reward</span>'
-        }
-        type_badge = type_badges.get(tx['tx_type'], f'<span class="badge badge-secondary">{tx["tx_type"]}</span>')
-        
-        # Format sender and recipient based on transaction type
-        sender = tx.get('sender', 'N/A')
-        recipient = tx.get('recipient', 'N/A')
-        
-        sender_display = f'<a href="/address/{sender}" style="font-family: monospace; font-size: 0.85em;">{sender[:12]}...</a>' if sender != 'N/A' else sender
-        recipient_display = f'<a href="/address/{recipient}" style="font-family: monospace; font-size: 0.85em;">{recipient[:12]}...</a>' if recipient != 'N/A' else recipient
-        
-        # Format amount and fee based on type
-        if tx['tx_type'] == 'epoch_attestation':
-            # For epoch attestations, show epoch number instead of amount
-            amount_display = f'Epoch {tx.get("epoch_number", "N/A")}'
-            fee_display = format_pals(tx.get('fee', 0))
-        else:
-            amount_display = format_pals(tx.get('amount', 0))
-            fee_display = format_pals(tx.get('fee', 0))
-        
-        tx_rows += f"""
-            <tr>
-                <td><a href="/tx/{tx['tx_hash']}" style="font-family: monospace; font-size: 0.85em;">{tx['tx_hash'][:16]}...</a></td>
-                <td>{type_badge}</td>
-                <td>{sender_display}</td>
-                <td>{recipient_display}</td>
-                <td>{amount_display}</td>
-                <td>{fee_display}</td>
-                <td><a href="/blocks/{tx['block_height']}">#{tx['block_height']}</a></td>
-                <td style="font-size: 0.85em;">{timestamp_str}</td>
-            </tr>
-        """
-    
     # SIMPLIFIED: Only show transfer filter - users only care about money transfers
     filter_buttons = ""
     # Removed all internal blockchain operation filters
@@ -912,27 +1451,30 @@ async def get_transactions(request: Request, page: int = 1, tx_filter: Optional[
     # Pagination links
     prev_link = ""
     next_link = ""
+    # Merge page into the current querystring so any filter params are kept and encoded
     if result['has_prev']:
-        prev_url = f'/transactions?page={page - 1}&hide_legacy={hide_legacy}' + (f'&tx_filter={tx_filter}' if tx_filter else '')
+        prev_url = request.url.include_query_params(page=page - 1, hide_legacy=hide_legacy, tx_filter=tx_filter)
+        prev_url = f"{prev_url.path}?{prev_url.query}"
         prev_link = f'<a href="{prev_url}" style="padding: 10px 20px; background: var(--gradient-start); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">← Previous</a>'
     
     if result['has_next']:
-        next_url = f'/transactions?page={page + 1}&hide_legacy={hide_legacy}' + (f'&tx_filter={tx_filter}' if tx_filter else '')
+        next_url = request.url.include_query_params(page=page + 1, hide_legacy=hide_legacy, tx_filter=tx_filter)
+        next_url = f"{next_url.path}?{next_url.query}"
         next_link = f'<a href="{next_url}" style="padding: 10px 20px; background: var(--gradient-start); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">Next →</a>'
     
-    html = f"""
+    head = f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Transactions - TIMPAL Explorer</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
+        {BASE_STYLES}
+        {THEME_TOGGLE_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
-        {get_navigation_html("transactions")}
+        {NAV_HTML["transactions"]}
         
         <div class="card">
             <h1>💸 Money Transfers</h1>
@@ -977,7 +1519,11 @@ async def get_transactions(request: Request, page: int = 1, tx_filter: Optional[
                     </tr>
                 </thead>
                 <tbody>
-                    {tx_rows if tx_rows else f'<tr><td colspan="8" style="text-align: center; padding: 40px; color: var(--text-secondary);">{"No money transfers yet - blockchain is waiting for users to send " + config.SYMBOL if tx_filter == "transfer" else "No transactions found"}</td></tr>'}
+    """
+    
+    empty_row = f'<tr><td colspan="8" style="text-align: center; padding: 40px; color: var(--text-secondary);">{"No money transfers yet - blockchain is waiting for users to send " + config.SYMBOL if tx_filter == "transfer" else "No transactions found"}</td></tr>'
+    
+    footer = f"""
                 </tbody>
             </table>
         </div>
@@ -997,7 +1543,10 @@ async def get_transactions(request: Request, page: int = 1, tx_filter: Optional[
     </html>
     """
     
-    return HTMLResponse(content=html)
+    return StreamingResponse(
+        _stream_tx_page(head, result['transactions'], empty_row, footer),
+        media_type="text/html"
+    )
 
 
 @app.get("/tx/{tx_hash}")
@@ -1009,14 +1558,10 @@ async def get_transaction(request: Request, tx_hash: str):
     tx_found = None
     block_found = None
     
-    for block in ledger.blocks:
-        for tx in block.transactions:
-            if tx.tx_hash == tx_hash:
-                tx_found = tx
-                block_found = block
-                break
-        if tx_found:
-            break
+    tx_height = ledger.get_tx_height(tx_hash)
+    if tx_height is not None:
+        block_found = ledger.blocks[tx_height]
+        tx_found = next((tx for tx in block_found.transactions if tx.tx_hash == tx_hash), None)
     
     if not tx_found or not block_found:
         raise HTTPException(status_code=404, detail="Transaction not found")
@@ -1024,7 +1569,7 @@ async def get_transaction(request: Request, tx_hash: str):
     # Format transaction data
     from datetime import datetime
     tx_data = tx_found.to_dict()
-    confirmations = len(ledger.blocks) - block_found.height
+    confirmations = ledger.head_height - block_found.height + 1
     timestamp_str = datetime.fromtimestamp(block_found.timestamp).strftime('%Y-%m-%d %H:%M:%S UTC')
     
     # Determine transaction type display
@@ -1042,12 +1587,12 @@ async def get_transaction(request: Request, tx_hash: str):
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Transaction {tx_hash[:16]}... - TIMPAL Explorer</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
+        {BASE_STYLES}
+        {THEME_TOGGLE_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
-        {get_navigation_html("tx")}
+        {NAV_HTML_NO_ACTIVE}
         
         <div class="card">
             <h1>{tx_type_display}</h1>
@@ -1163,81 +1708,20 @@ async def get_transaction(request: Request, tx_hash: str):
     return HTMLResponse(html)
 
 
-@app.get("/send", response_class=HTMLResponse)
-@limiter.limit("15/minute")
-async def send_transfer_page(request: Request):
-    """Send money transfer page"""
-    ledger = get_ledger()
-    
-    # Default wallet path for backend
-    default_wallet_path = "testnet_data_node_9000/validator_wallet.json"
-    
-    html = f"""
+# The send page has no per-request data, so it is rendered, minified and
+# gzipped once at import instead of on every visit.
+_SEND_PAGE_HTML = _minify_html(f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Send Transfer | TIMPAL Block Explorer</title>
-        {get_base_styles()}
-        <style>
-            .form-group {{
-                margin-bottom: 20px;
-            }}
-            label {{
-                display: block;
-                margin-bottom: 5px;
-                font-weight: 600;
-            }}
-            input, textarea {{
-                width: 100%;
-                padding: 12px;
-                background: var(--bg-color);
-                border: 1px solid var(--border-color);
-                border-radius: 6px;
-                color: var(--text-color);
-                font-size: 1em;
-                box-sizing: border-box;
-            }}
-            input:focus, textarea:focus {{
-                outline: none;
-                border-color: #00d4ff;
-            }}
-            .btn-submit {{
-                background: linear-gradient(135deg, #00d4ff 0%, #0099ff 100%);
-                color: white;
-                padding: 15px 30px;
-                border: none;
-                border-radius: 8px;
-                font-size: 1.1em;
-                font-weight: 600;
-                cursor: pointer;
-                width: 100%;
-                transition: all 0.3s;
-            }}
-            .btn-submit:hover {{
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(0, 212, 255, 0.4);
-            }}
-            .info-box {{
-                background: rgba(0, 212, 255, 0.1);
-                border-left: 4px solid #00d4ff;
-                padding: 15px;
-                margin: 20px 0;
-                border-radius: 6px;
-            }}
-            .success {{
-                background: rgba(0, 255, 136, 0.1);
-                border-left-color: #00ff88;
-            }}
-            .error {{
-                background: rgba(255, 68, 68, 0.1);
-                border-left-color: #ff4444;
-            }}
-        </style>
+        {BASE_STYLES}
+        {SEND_STYLES}
     </head>
     <body>
-        {get_navigation_html()}
+        {NAV_HTML["home"]}
         
         <div class="container">
             <div class="header">
@@ -1296,7 +1780,7 @@ async def send_transfer_page(request: Request):
             </div>
         </div>
         
-        {get_theme_toggle_script()}
+        {THEME_TOGGLE_SCRIPT}
         
         <script>
             document.getElementById('transferForm').addEventListener('submit', async (e) => {{
@@ -1316,9 +1800,24 @@ async def send_transfer_page(request: Request):
                         body: new URLSearchParams(formData)
                     }});
                     
-                    const result = await response.json();
+                    let result = await response.json();
                     
-                    if (response.ok) {{
+                    // 202: signed and queued; poll until the node has accepted or rejected it
+                    if (response.status === 202) {{
+                        resultDiv.innerHTML = '<div class="info-box">📡 Broadcasting transaction...</div>';
+                        while (result.status === 'pending') {{
+                            await new Promise(resolve => setTimeout(resolve, 500));
+                            const statusResponse = await fetch(result.status_url || `/tx_status/${{result.client_id}}`);
+                            const status = await statusResponse.json();
+                            if (!statusResponse.ok) {{
+                                result = {{status: 'error', error: status.detail}};
+                            }} else {{
+                                result = {{...result, ...status}};
+                            }}
+                        }}
+                    }}
+                    
+                    if (response.ok && result.status !== 'error') {{
                         resultDiv.innerHTML = `
                             <div class="info-box success">
                                 <h3>✅ Transfer Submitted Successfully!</h3>
@@ -1350,13 +1849,132 @@ async def send_transfer_page(request: Request):
         </script>
     </body>
     </html>
+    """)
+_SEND_PAGE_HTML_GZ = gzip.compress(_SEND_PAGE_HTML.encode(), compresslevel=9)
+_SEND_PAGE_ETAG = _make_etag(_SEND_PAGE_HTML)
+
+
+@app.get("/send", response_class=HTMLResponse)
+@limiter.limit("15/minute")
+async def send_transfer_page(request: Request):
+    """Send money transfer page"""
+    return precompressed_response(request, _SEND_PAGE_HTML, _SEND_PAGE_HTML_GZ, _SEND_PAGE_ETAG)
+
+
+def _wallet_addresses(meta: Dict[str, Any]) -> set:
+    """Addresses listed in a wallet file's (unencrypted) account metadata"""
+    version = meta.get("version", 1)
+    if version == 3:
+        return {
+            acct["address"]
+            for vault in meta.get("vaults", [])
+            for acct in vault.get("accounts", [])
+        }
+    if version == 2:
+        # v2 only stores one derived account (0) in practice
+        account = meta.get("accounts", {}).get("0")
+        return {account["address"]} if account else set()
+    return set()
+
+
+def _discover_wallets() -> Dict[str, Tuple[float, int, set]]:
     """
-    return HTMLResponse(html)
+    Refresh and return the local wallet index.
+    
+    Auto-discovers wallet files (v3 wallets.json, v2 wallet_v2.json, legacy wallet.json)
+    matching WALLET_GLOB and only opens the ones that are new or changed since the last call.
+    """
+    wallet_files = {wf for wf in glob.glob(WALLET_GLOB) if os.path.basename(wf) != WALLET_INDEX_FILE}
+
+    for wf in list(_WALLET_INDEX):
+        if wf not in wallet_files:
+            del _WALLET_INDEX[wf]
+
+    for wf in wallet_files:
+        try:
+            mtime = os.stat(wf).st_mtime
+            cached = _WALLET_INDEX.get(wf)
+            if cached and cached[0] == mtime:
+                continue
+            with open(wf, "r") as f:
+                meta = json.load(f)
+            _WALLET_INDEX[wf] = (mtime, meta.get("version", 1), _wallet_addresses(meta))
+        except Exception:
+            _WALLET_INDEX.pop(wf, None)
+
+    return _WALLET_INDEX
+
+
+def _unlock_sender_wallet(sender_address: str, password: str, pin: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Find and decrypt the local wallet holding sender_address
+    
+    Blocking (file IO + Argon2 key derivation); call it off the event loop.
+    
+    Returns:
+        Tuple of (private_key, public_key, error); error is set when no key is returned
+    """
+    # The wallet index written on save points straight at the right file;
+    # the directory scan only runs if the address is not indexed (or the index is stale)
+    indexed = lookup_wallet(WALLET_DIR, sender_address)
+    if indexed:
+        unlocked = _unlock_wallet_file(*indexed, sender_address, password, pin)
+        if unlocked:
+            return unlocked
+
+    for wf, (_mtime, version, addresses) in _discover_wallets().items():
+        if sender_address in addresses and not (indexed and os.path.samefile(wf, indexed[0])):
+            unlocked = _unlock_wallet_file(wf, version, sender_address, password, pin)
+            if unlocked:
+                return unlocked
+
+    return None, None, "Wallet not found for this address, incorrect password, or unsupported wallet"
+
+
+def _unlock_wallet_file(wf: str, version: int, sender_address: str, password: str, pin: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """Try to unlock sender_address from one wallet file (None if it cannot be found/decrypted there)"""
+    try:
+        if version == 3:
+            mw = MultiWallet(wf)
+            mw.load(password)
+            found = mw.find_account(sender_address)
+            if not found:
+                return None
+            vault_id, acct = found
+            vault = mw.get_vault(vault_id)
+            if not vault.validate_pin(pin):
+                return None, None, "Incorrect PIN"
+            _addr, wallet_public_key, wallet_private_key = mw.export_account_private_key(
+                password, vault_id=vault_id, index=acct.index
+            )
+            return wallet_private_key, wallet_public_key, None
+
+        if version == 2:
+            temp_wallet = SeedWallet(wf)
+            temp_wallet.load_wallet(password)
+            # v2 only stores one derived account (0) in practice
+            account = temp_wallet.accounts.get(0)
+            if account and account["address"] == sender_address:
+                if not temp_wallet.validate_pin(pin):
+                    return None, None, "Incorrect PIN"
+                return account["private_key"], account["public_key"], None
+
+    except Exception:
+        pass
+
+    return None
+
+
+async def fetch_node_account(session: aiohttp.ClientSession, address: str) -> Optional[Dict[str, Any]]:
+    """Get balance and pending nonce for an address from the node API (None on a non-200 reply)"""
+    async with session.get(f"{NODE_BASE_URL}/api/account/{address}") as resp:
+        if resp.status != 200:
+            return None
+        return json_loads(await resp.read())
 
 
 @app.post("/send")
 @limiter.limit("5/minute")
-async def submit_transfer(request: Request, sender_address: str = Form(...), password: str = Form(...), pin: str = Form(...), recipient: str = Form(...), amount: float = Form(...)):
+async def submit_transfer(request: Request, sender_address: str = Form(...), password: str = Form(...), pin: str = Form(...), recipient: str = Form(...), amount: str = Form(...)):
     """Handle transfer submission"""
     try:
         # Strip whitespace from addresses
@@ -1364,89 +1982,51 @@ async def submit_transfer(request: Request, sender_address: str = Form(...), pas
         recipient = recipient.strip()
         
         # Validate inputs
-        if not sender_address.startswith("tmpl"):
-            return JSONResponse({"error": "Invalid sender address - must start with 'tmpl'"}, status_code=400)
+        if not _ADDRESS_RE.fullmatch(sender_address):
+            return JSONResponse({"error": "Invalid sender address - must be 'tmpl' followed by 44 hex characters"}, status_code=400)
         
-        if not recipient.startswith("tmpl"):
-            return JSONResponse({"error": "Invalid recipient address - must start with 'tmpl'"}, status_code=400)
+        if not _ADDRESS_RE.fullmatch(recipient):
+            return JSONResponse({"error": "Invalid recipient address - must be 'tmpl' followed by 44 hex characters"}, status_code=400)
         
-        # Validate amount
+        # Validate amount (parsed as Decimal so the TMPL -> pals conversion is exact)
         try:
-            amount = float(amount)
-            if amount <= 0:
+            amount_tmpl = Decimal(amount.strip())
+            if not amount_tmpl.is_finite():
+                return JSONResponse({"error": "Invalid amount format"}, status_code=400)
+            if amount_tmpl <= 0:
                 return JSONResponse({"error": "Amount must be greater than 0"}, status_code=400)
-        except ValueError:
+        except (InvalidOperation, ValueError):
             return JSONResponse({"error": "Invalid amount format"}, status_code=400)
         
-        # Auto-discover wallet files (v3 wallets.json, v2 wallet_v2.json, legacy wallet.json)
-        import glob
-        import json
-        from app.seed_wallet import SeedWallet
-        from app.metawallet import MultiWallet
-
-        wallet_files = (
-            glob.glob("wallets.json")
-            + glob.glob("wallet*.json")
-            + glob.glob("**/wallets.json", recursive=True)
-            + glob.glob("**/wallet*.json", recursive=True)
+        # The account lookup does not depend on the wallet, so it is sent to the node
+        # while the (Argon2, CPU-bound) wallet unlock runs in a worker thread. The
+        # nonce itself is covered by the signature, so the node cannot fill it in.
+        session = get_node_session(request)
+        unlocked, account_data = await asyncio.gather(
+            asyncio.to_thread(_unlock_sender_wallet, sender_address, password, pin),
+            fetch_node_account(session, sender_address),
+            return_exceptions=True
         )
-
-        wallet_private_key = None
-        wallet_public_key = None
-
-        for wf in wallet_files:
-            try:
-                with open(wf, "r") as f:
-                    meta = json.load(f)
-                version = meta.get("version", 1)
-
-                if version == 3:
-                    mw = MultiWallet(wf)
-                    mw.load(password)
-                    found = mw.find_account(sender_address)
-                    if not found:
-                        continue
-                    vault_id, acct = found
-                    vault = mw.get_vault(vault_id)
-                    if not vault.validate_pin(pin):
-                        return JSONResponse({"error": "Incorrect PIN"}, status_code=400)
-                    _addr, wallet_public_key, wallet_private_key = mw.export_account_private_key(
-                        password, vault_id=vault_id, index=acct.index
-                    )
-                    break
-
-                if version == 2:
-                    temp_wallet = SeedWallet(wf)
-                    temp_wallet.load_wallet(password)
-                    # v2 only stores one derived account (0) in practice
-                    account = temp_wallet.accounts.get(0)
-                    if account and account["address"] == sender_address:
-                        if not temp_wallet.validate_pin(pin):
-                            return JSONResponse({"error": "Incorrect PIN"}, status_code=400)
-                        wallet_private_key = account["private_key"]
-                        wallet_public_key = account["public_key"]
-                        break
-
-            except Exception:
-                continue
-
-        if not wallet_private_key or not wallet_public_key:
-            return JSONResponse({"error": "Wallet not found for this address, incorrect password, or unsupported wallet"}, status_code=400)
-        
-        # Get current nonce from node
-        import os
-        node_api_port = os.getenv("EXPLORER_API_PORT", "9001")
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"http://localhost:{node_api_port}/api/account/{sender_address}") as resp:
-                if resp.status == 200:
-                    account_data = await resp.json()
-                    nonce = account_data['pending_nonce']
-                    balance = account_data['balance']
-                else:
-                    return JSONResponse({"error": "Failed to fetch account info from node"}, status_code=500)
-        
-        # Convert TMPL to pals (use round() to avoid floating-point precision errors)
-        amount_pals = round(amount * config.PALS_PER_TMPL)
+        if isinstance(unlocked, BaseException):
+            raise unlocked
+        wallet_private_key, wallet_public_key, wallet_error = unlocked
+        if wallet_error:
+            return JSONResponse({"error": wallet_error}, status_code=400)
+        
+        if isinstance(account_data, BaseException):
+            raise account_data
+        if account_data is None:
+            return JSONResponse({"error": "Failed to fetch account info from node"}, status_code=500)
+        # One node round-trip serves both: balance for the precheck below and the
+        # mempool-aware pending nonce, which the explorer's on-disk ledger cannot provide
+        nonce = account_data['pending_nonce']
+        balance = account_data['balance']
+        last_signed = _last_signed_nonce.get(sender_address)
+        if last_signed:
+            nonce = max(nonce, last_signed[0] + 1)
+        
+        # Convert TMPL to pals (sub-pal digits are rounded half-even, like round())
+        amount_pals = int((amount_tmpl * config.PALS_PER_TMPL).to_integral_value())
         fee_pals = 50000  # 0.0005 TMPL fixed fee
         
         # Check balance
@@ -1466,148 +2046,82 @@ async def submit_transfer(request: Request, sender_address: str = Form(...), pas
         tx.public_key = wallet_public_key
         tx.sign(wallet_private_key)
         
-        # Submit to node's HTTP API
-        import os
-        node_api_port = os.getenv("EXPLORER_API_PORT", "9001")
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"http://localhost:{node_api_port}/submit_transaction", json=tx.to_dict()) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    return JSONResponse({
-                        "status": "success",
-                        "message": "Transaction broadcast to network!",
-                        "tx_hash": result['tx_hash']
-                    })
-                else:
-                    error_text = await resp.text()
-                    return JSONResponse({"error": f"Node rejected transaction: {error_text}"}, status_code=400)
+        # Queue for broadcast; the node's verdict is reported on /tx_status/{client_id}
+        client_id = uuid.uuid4().hex
+        _tx_status[client_id] = (time.time(), {"status": "pending", "tx_hash": tx.tx_hash})
+        _last_signed_nonce[sender_address] = (nonce, time.time())
+        get_submit_queue(request.app).put_nowait((client_id, tx.to_dict()))
+        return JSONResponse({
+            "status": "pending",
+            "message": "Transaction signed and queued for broadcast",
+            "tx_hash": tx.tx_hash,
+            "client_id": client_id,
+            "status_url": f"/tx_status/{client_id}"
+        }, status_code=202)
                     
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
+@app.get("/tx_status/{client_id}")
+@limiter.limit("120/minute")
+async def get_tx_status(request: Request, client_id: str):
+    """Broadcast status of a transfer queued by POST /send (pending, success or error)"""
+    entry = _tx_status.get(client_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired transfer id")
+    return entry[1]
+
+
+# Compiled once at import; rendering then runs as template bytecode per request
+_templates = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_templates.globals["format_pals"] = format_pals
+_ADDR_TMPL = _templates.get_template("address.html")
+_ADDR_PAGE_ASSETS = {
+    "base_styles": Markup(BASE_STYLES),
+    "theme_toggle_script": Markup(THEME_TOGGLE_SCRIPT),
+    "navigation": Markup(NAV_HTML_NO_ACTIVE),
+}
+
+
 @app.get("/address/{address}", response_class=HTMLResponse)
 @limiter.limit("15/minute")
 async def get_address(request: Request, address: str):
     """Get address balance and transaction history page"""
-    if not address.startswith("tmpl"):
+    if not _ADDRESS_RE.fullmatch(address):
         raise HTTPException(status_code=400, detail="Invalid TIMPAL address format")
     
     ledger = get_ledger()
     balance = ledger.get_balance(address)
-    transactions = get_address_transactions(ledger, address)
+    transactions = get_address_transactions(ledger, address, limit=50)  # Show latest 50 transactions
     
-    sent_count = sum(1 for tx in transactions if tx['sender'] == address)
-    received_count = sum(1 for tx in transactions if tx['recipient'] == address)
+    address_stats = ledger.get_address_stats(address)
+    tx_count = address_stats['tx_count']
+    sent_count = address_stats['sent_count']
+    received_count = address_stats['recv_count']
     
-    total_sent = sum(tx['amount'] + tx['fee'] for tx in transactions if tx['sender'] == address)
-    total_received = sum(tx['amount'] for tx in transactions if tx['recipient'] == address)
+    total_sent = address_stats['total_sent_pals']
+    total_received = address_stats['total_recv_pals']
     
     is_validator = address in config.GENESIS_VALIDATORS
-    validator_info = ledger.get_validator_info(address) if is_validator else None
-    
-    # Build transaction rows
-    tx_rows = ""
-    for tx in transactions[:50]:  # Show latest 50 transactions
-        tx_type_icon = "📤" if tx['sender'] == address else "📥"
-        tx_type_label = "Sent" if tx['sender'] == address else "Received"
-        tx_rows += f"""
-            <tr>
-                <td>{tx_type_icon} {tx_type_label}</td>
-                <td><a href="/tx/{tx['tx_hash']}" style="font-family: monospace; font-size: 0.85em;">{tx['tx_hash'][:16]}...</a></td>
-                <td><a href="/address/{tx['sender']}" style="font-family: monospace; font-size: 0.85em;">{tx['sender'][:12]}...</a></td>
-                <td><a href="/address/{tx['recipient']}" style="font-family: monospace; font-size: 0.85em;">{tx['recipient'][:12]}...</a></td>
-                <td>{format_pals(tx['amount'])}</td>
-                <td><a href="/blocks/{tx.get('block_height', '?')}">#{tx.get('block_height', '?')}</a></td>
-            </tr>
-        """
     
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Address {address[:16]}... - TIMPAL Explorer</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
-    </head>
-    <body>
-        <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
-        {get_navigation_html("address")}
-        
-        <div class="card">
-            <h1>{'🛡️ Validator Address' if is_validator else '💼 Wallet Address'}</h1>
-            <p style="color: var(--text-secondary); word-break: break-all; font-family: monospace; font-size: 0.9em;">
-                {address}
-            </p>
-            {f'<span class="badge badge-success" style="font-size: 0.9em;">✅ Active Validator</span>' if is_validator else ''}
-        </div>
-        
-        <div class="card">
-            <h2>💰 Balance & Statistics</h2>
-            <table class="table">
-                <tbody>
-                    <tr>
-                        <td><strong>Current Balance</strong></td>
-                        <td><span style="font-size: 1.3em; font-weight: bold; color: var(--gradient-start);">{format_pals(balance)}</span></td>
-                    </tr>
-                    <tr>
-                        <td><strong>Total Transactions</strong></td>
-                        <td>{len(transactions)}</td>
-                    </tr>
-                    <tr>
-                        <td><strong>Transactions Sent</strong></td>
-                        <td>{sent_count}</td>
-                    </tr>
-                    <tr>
-                        <td><strong>Transactions Received</strong></td>
-                        <td>{received_count}</td>
-                    </tr>
-                    <tr>
-                        <td><strong>Total Sent</strong></td>
-                        <td>{format_pals(total_sent)}</td>
-                    </tr>
-                    <tr>
-                        <td><strong>Total Received</strong></td>
-                        <td>{format_pals(total_received)}</td>
-                    </tr>
-                    {f'''<tr>
-                        <td><strong>Validator Status</strong></td>
-                        <td><span class="badge badge-success">Active Validator</span></td>
-                    </tr>''' if is_validator else ''}
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="card">
-            <h2>📜 Transaction History ({len(transactions)})</h2>
-            {f'''
-            <table class="table">
-                <thead>
-                    <tr>
-                        <th>Type</th>
-                        <th>Transaction Hash</th>
-                        <th>From</th>
-                        <th>To</th>
-                        <th>Amount</th>
-                        <th>Block</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {tx_rows}
-                </tbody>
-            </table>
-            ''' if transactions else '<p style="text-align: center; color: var(--text-secondary); padding: 20px;">No transactions found for this address</p>'}
-            {f'<p style="text-align: center; color: var(--text-secondary); margin-top: 10px; font-size: 0.9em;">Showing latest 50 transactions</p>' if len(transactions) > 50 else ''}
-        </div>
-        
-        <div class="card" style="text-align: center;">
-            <a href="/" style="padding: 10px 20px; background: var(--text-secondary); color: white; border-radius: 5px; text-decoration: none; font-weight: bold;">🏠 Home</a>
-        </div>
-    </body>
-    </html>
-    """
+    html = _ADDR_TMPL.render(
+        **_ADDR_PAGE_ASSETS,
+        address=address,
+        is_validator=is_validator,
+        balance=balance,
+        tx_count=tx_count,
+        sent_count=sent_count,
+        received_count=received_count,
+        total_sent=total_sent,
+        total_received=total_received,
+        transactions=transactions,
+    )
     
     return HTMLResponse(content=html)
 
@@ -1616,7 +2130,18 @@ async def get_address(request: Request, address: str):
 @limiter.limit("30/minute")
 async def get_stats(request: Request):
     """Get blockchain statistics (optimized with caching)"""
+    global _stats_response, _stats_response_tip
+    
     ledger = get_ledger()
+    tip = get_chain_tip(ledger)
+    # The stats only change with the chain tip, so the tip identifies the payload;
+    # pollers (the live-updates fallback) revalidate with If-None-Match
+    headers = {"ETag": f'"{tip[0]}-{tip[1][:16]}"'}
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if tip == _stats_response_tip:
+        return FastJSONResponse(_stats_response, headers=headers)
+    
     latest_block = ledger.get_latest_block()
     
     cached = get_cached_stats(ledger)
@@ -1624,9 +2149,9 @@ async def get_stats(request: Request):
     phase1_blocks = config.PHASE1_BLOCKS
     current_phase = 1 if latest_block and latest_block.height < phase1_blocks else 2
     
-    return {
+    _stats_response = {
         "chain_height": latest_block.height if latest_block else 0,
-        "total_blocks": len(ledger.blocks),
+        "total_blocks": tip[0],
         "total_transactions": cached['transfer_count'],
         "total_supply": ledger.total_emitted_pals,
         "total_supply_tmpl": format_pals(ledger.total_emitted_pals),
@@ -1640,66 +2165,67 @@ async def get_stats(request: Request):
         "block_time": config.BLOCK_TIME,
         "validator_count": ledger.get_validator_count()
     }
+    _stats_response_tip = tip
+    return FastJSONResponse(_stats_response, headers=headers)
 
 
 @app.get("/validators")
 @limiter.limit("30/minute")
 async def get_validators(request: Request):
     """Get all registered validators (dynamic validator set) - optimized"""
+    global _validators_response, _validators_response_tip
+    
     ledger = get_ledger()
+    tip = get_chain_tip(ledger)
+    if tip == _validators_response_tip:
+        return _validators_response
+    
     validators = []
     
-    current_height = ledger.get_block_count() - 1
-    LIVENESS_WINDOW = 30  # ~90 seconds at 3s/block - proof of activity window
+    current_height = ledger.head_height
     
     cached_validator_stats = get_cached_validator_stats(ledger)
+    no_stats = {
+        'blocks_proposed': 0,
+        'total_rewards': 0,
+        'last_block_height': -1
+    }
     
-    for address, validator_data in ledger.validator_registry.items():
-        info = ledger.get_validator_info(address)
-        
+    # FILTER: Only show ACTIVE/ONLINE validators (user request)
+    # Offline validators should not appear in the list or network graph, so they
+    # are skipped before their info/balance is looked up or a row dict is built
+    active_addresses = []
+    for address in ledger.validator_registry:
+        last_block_height = cached_validator_stats.get(address, no_stats)['last_block_height']
+        if get_display_status(last_block_height, current_height) == "active":
+            active_addresses.append(address)
+    
+    for address, (info, balance) in ledger.snapshot_validators(active_addresses).items():
         if info:
-            balance = ledger.get_balance(address)
-            
-            stats = cached_validator_stats.get(address, {
-                'blocks_proposed': 0,
-                'total_rewards': 0,
-                'last_block_height': -1
-            })
-            
-            block_count = stats['blocks_proposed']
-            last_block_height = stats['last_block_height']
-            
-            if current_height < 10:
-                display_status = "active"
-            elif last_block_height >= 0 and (current_height - last_block_height) <= LIVENESS_WINDOW:
-                display_status = "active"
-            else:
-                display_status = "offline"
+            stats = cached_validator_stats.get(address, no_stats)
             
             validators.append({
                 "address": address,
                 "public_key": info.get('public_key', 'N/A'),
                 "balance": balance,
                 "balance_tmpl": format_pals(balance),
-                "blocks_proposed": block_count,
-                "status": display_status,
+                "blocks_proposed": stats['blocks_proposed'],
+                "status": "active",
                 "registered_at": info.get('registered_at', 0),
-                "device_id_preview": info.get('device_id', 'N/A')[:32] + '...' if info.get('device_id') and len(info.get('device_id', '')) > 32 else info.get('device_id', 'N/A')
+                "device_id_preview": _device_id_preview(info)
             })
     
-    # FILTER: Only show ACTIVE/ONLINE validators (user request)
-    # Offline validators should not appear in the list or network graph
-    active_validators = [v for v in validators if v['status'] == 'active']
-    
     # Sort by blocks proposed (most active first)
-    active_validators.sort(key=lambda v: v.get('blocks_proposed', 0), reverse=True)
+    validators.sort(key=itemgetter('blocks_proposed'), reverse=True)
     
-    return {
-        "validators": active_validators,
-        "total_count": len(active_validators),
-        "active_count": len(active_validators),
+    _validators_response = {
+        "validators": validators,
+        "total_count": len(validators),
+        "active_count": len(validators),
         "inactive_count": 0  # Not showing offline validators
     }
+    _validators_response_tip = tip
+    return _validators_response
 
 
 # ============================================================================
@@ -1738,6 +2264,22 @@ async def api_get_blockchain_info(request: Request):
     }
 
 
+def _encode_blocks_range(blocks: List, start: int, end: int) -> bytes:
+    """Encode an /api/blocks/range body from the per-block JSON in _block_json_cache"""
+    encoded = []
+    for block in blocks:
+        with _block_json_lock:
+            block_json = _block_json_cache.get(block.block_hash)
+        if block_json is None:
+            block_json = json_dumps(block.to_dict())
+            with _block_json_lock:
+                if len(_block_json_cache) >= BLOCK_JSON_CACHE_SIZE:
+                    _block_json_cache.pop(next(iter(_block_json_cache)), None)
+                _block_json_cache[block.block_hash] = block_json
+        encoded.append(block_json)
+    return b'{"blocks":[' + b",".join(encoded) + b'],"count":%d,"start":%d,"end":%d}' % (len(encoded), start, end)
+
+
 @app.get("/api/blocks/range")
 @limiter.limit("100/minute")
 async def api_get_blocks_range(request: Request, start: int, end: int):
@@ -1764,22 +2306,11 @@ async def api_get_blocks_range(request: Request, start: int, end: int):
     if end - start + 1 > 100:
         raise HTTPException(status_code=400, detail="Range too large: max 100 blocks per request")
     
-    # Get blocks in SEQUENTIAL ORDER (critical for sync)
-    blocks = []
-    for height in range(start, end + 1):
-        if height < len(ledger.blocks):
-            block = ledger.blocks[height]
-            blocks.append(block.to_dict())
-        else:
-            # Block doesn't exist yet - return what we have so far
-            break
-    
-    return {
-        "blocks": blocks,
-        "count": len(blocks),
-        "start": start,
-        "end": end
-    }
+    # Get blocks in SEQUENTIAL ORDER (critical for sync); blocks that don't exist
+    # yet are simply cut off by the slice - return what we have so far.
+    # Serializing up to 100 blocks runs in a worker thread, off the event loop.
+    body = await asyncio.to_thread(_encode_blocks_range, ledger.blocks[start:end + 1], start, end)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/search-redirect")
@@ -1803,134 +2334,52 @@ async def search(request: Request, query: str):
         if block:
             return RedirectResponse(url=f"/blocks/{block.height}", status_code=303)
     
-    # Search for address
-    if query.startswith("tmpl"):
-        balance = ledger.get_balance(query)
-        if balance > 0 or query in config.GENESIS_VALIDATORS:
-            return RedirectResponse(url=f"/address/{query}", status_code=303)
+    # Search for address (any address the ledger holds a balance entry for)
+    if _ADDRESS_RE.fullmatch(query) and (query in ledger.balances or query in config.GENESIS_VALIDATORS):
+        return RedirectResponse(url=f"/address/{query}", status_code=303)
     
-    # Search for block hash or transaction hash
-    for block in ledger.blocks:
-        if block.block_hash == query:
-            return RedirectResponse(url=f"/blocks/{block.height}", status_code=303)
+    # Search for block hash or transaction hash (hash-indexed on the ledger). Anything
+    # not shaped like a hash is rejected here, without building the index for it.
+    if _HASH_RE.fullmatch(query):
+        block_height = ledger.get_height_by_block_hash(query)
+        if block_height is not None:
+            return RedirectResponse(url=f"/blocks/{block_height}", status_code=303)
         
-        for tx in block.transactions:
-            if tx.tx_hash == query:
-                return RedirectResponse(url=f"/tx/{query}", status_code=303)
+        if ledger.get_tx_height(query) is not None:
+            return RedirectResponse(url=f"/tx/{query}", status_code=303)
     
     raise HTTPException(status_code=404, detail="No results found")
 
 
-@app.get("/stream")
+@app.get("/stream", response_class=EventSourceResponse)
 async def stream(request: Request):
     """Server-Sent Events (SSE) endpoint for real-time blockchain updates (optimized)"""
-    async def event_generator():
-        last_height = 0
-        consecutive_errors = 0
-        max_consecutive_errors = 5
-        
-        while True:
-            if await request.is_disconnected():
-                break
-            
-            try:
-                ledger = get_ledger()
-                latest_block = ledger.get_latest_block()
-                current_height = latest_block.height if latest_block else 0
-                
-                if current_height != last_height:
-                    last_height = current_height
-                    consecutive_errors = 0
-                    
-                    cached = get_cached_stats(ledger)
-                    
-                    data = {
-                        "latest_block": current_height,
-                        "total_supply_tmpl": format_pals(ledger.total_emitted_pals),
-                        "validator_count": ledger.get_validator_count(),
-                        "total_transactions": cached['transfer_count'],
-                        "timestamp": time.time()
-                    }
-                    
-                    yield f"data: {json.dumps(data)}\n\n"
-                
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                consecutive_errors += 1
-                print(f"SSE Error ({consecutive_errors}/{max_consecutive_errors}): {e}")
-                if consecutive_errors >= max_consecutive_errors:
-                    print("SSE: Too many consecutive errors, closing connection")
-                    break
-                await asyncio.sleep(1)
-    
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
-
-
-@app.get("/validators-dashboard", response_class=HTMLResponse)
-@limiter.limit("20/minute")
-async def validators_dashboard(request: Request):
-    """Enhanced validator dashboard with detailed stats and leaderboard (optimized)"""
-    ledger = get_ledger()
-    validators = []
-    
-    current_height = ledger.get_block_count() - 1
-    LIVENESS_WINDOW = 30  # ~90 seconds at 3s/block - proof of activity window
-    
-    cached_validator_stats = get_cached_validator_stats(ledger)
-    
-    for address, validator_data in ledger.validator_registry.items():
-        info = ledger.get_validator_info(address)
-        
-        if info:
-            balance = ledger.get_balance(address)
-            
-            stats = cached_validator_stats.get(address, {
-                'blocks_proposed': 0,
-                'total_rewards': 0,
-                'last_block_height': -1
-            })
-            
-            block_count = stats['blocks_proposed']
-            total_rewards = stats['total_rewards']
-            last_block_height = stats['last_block_height']
-            
-            if current_height < 10:
-                display_status = "active"
-            elif last_block_height >= 0 and (current_height - last_block_height) <= LIVENESS_WINDOW:
-                display_status = "active"
-            else:
-                display_status = "offline"
-            
-            validators.append({
-                "address": address,
-                "public_key": info.get('public_key', 'N/A')[:64] + '...',
-                "balance": balance,
-                "balance_tmpl": format_pals(balance),
-                "blocks_proposed": block_count,
-                "total_rewards": total_rewards,
-                "total_rewards_tmpl": format_pals(total_rewards),
-                "status": display_status,
-                "registered_at": info.get('registered_at', 0),
-                "device_id_preview": info.get('device_id', 'N/A')[:32] + '...' if info.get('device_id') and len(info.get('device_id', '')) > 32 else info.get('device_id', 'N/A')
-            })
-    
-    validators.sort(key=lambda v: v['blocks_proposed'], reverse=True)
-    
-    # Calculate stats
-    total_validators = len(validators)
-    active_validators = sum(1 for v in validators if v['status'] == 'active')
-    total_blocks_by_validators = sum(v['blocks_proposed'] for v in validators)
-    
-    html = f"""
+    condition = get_stream_condition(request.app)
+    state = request.app.state
+    last_event = None
+    
+    while True:
+        # Send the latest event right away, then sleep until the watcher has a newer one
+        async with condition:
+            await condition.wait_for(lambda: state.stream_event is not last_event)
+            last_event = state.stream_event
+        yield last_event
+
+
+# The validator dashboard page is a static shell (rendered, minified and gzipped
+# once at import); its numbers, leaderboard and charts are filled in from
+# /api/validators-dashboard.json, which is cached per chain tip.
+_VALIDATORS_DASHBOARD_HTML = _minify_html(f"""
     <!DOCTYPE html>
     <html>
     <head>
+        <meta charset="UTF-8">
+        {CDN_PRECONNECT}
         <title>TIMPAL Validator Dashboard</title>
-        {get_base_styles()}
-        {get_chart_js_cdn()}
-        {get_theme_toggle_script()}
-        {get_live_updates_script()}
+        {BASE_STYLES}
+        {CHART_JS_CDN}
+        {THEME_TOGGLE_SCRIPT}
+        {LIVE_UPDATES_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
@@ -1940,21 +2389,21 @@ async def validators_dashboard(request: Request):
             <p><span class="live-indicator"></span> Real-time validator registry and performance metrics</p>
         </div>
         
-        {get_navigation_html("validators")}
+        {NAV_HTML["validators"]}
         
         <div class="stats">
             <div class="stat-card">
                 <div class="stat-label">Total Validators</div>
-                <div class="stat-value" id="live-validator-count">{total_validators}</div>
+                <div class="stat-value" id="live-validator-count">-</div>
             </div>
             <div class="stat-card">
                 <div class="stat-label">Active Validators</div>
-                <div class="stat-value">{active_validators}</div>
+                <div class="stat-value" id="active-validator-count">-</div>
                 <div class="stat-trend">✓ 100% Decentralized</div>
             </div>
             <div class="stat-card">
                 <div class="stat-label">Total Blocks Proposed</div>
-                <div class="stat-value">{total_blocks_by_validators}</div>
+                <div class="stat-value" id="total-blocks-proposed">-</div>
             </div>
             <div class="stat-card">
                 <div class="stat-label">Sybil Protection</div>
@@ -1978,26 +2427,8 @@ async def validators_dashboard(request: Request):
                         <th>Device ID</th>
                     </tr>
                 </thead>
-                <tbody>
-    """
-    
-    for idx, v in enumerate(validators, 1):
-        status_badge = 'badge-success' if v['status'] == 'active' else 'badge-secondary'
-        rank_emoji = '🥇' if idx == 1 else ('🥈' if idx == 2 else ('🥉' if idx == 3 else f'{idx}.'))
-        
-        html += f"""
-                    <tr>
-                        <td>{rank_emoji}</td>
-                        <td><span class="monospace">{v['address'][:20]}...</span></td>
-                        <td><span class="badge {status_badge}">{v['status'].upper()}</span></td>
-                        <td><strong>{v['blocks_proposed']}</strong></td>
-                        <td>{v['total_rewards_tmpl']}</td>
-                        <td>{v['balance_tmpl']}</td>
-                        <td><span class="monospace">{v['device_id_preview']}</span></td>
-                    </tr>
-        """
-    
-    html += """
+                <tbody id="leaderboard-rows">
+                    <tr><td colspan="7" style="text-align: center; color: var(--text-secondary);">Loading validators...</td></tr>
                 </tbody>
             </table>
         </div>
@@ -2019,129 +2450,214 @@ async def validators_dashboard(request: Request):
         </div>
         
         <script>
-            // Block Proposal Distribution Chart
-            const proposalCtx = document.getElementById('proposalChart').getContext('2d');
-            new Chart(proposalCtx, {
-                type: 'bar',
-                data: {
-                    labels: """ + json.dumps([f"#{i+1}" for i in range(min(10, len(validators)))]) + """,
-                    datasets: [{
-                        label: 'Blocks Proposed',
-                        data: """ + json.dumps([v['blocks_proposed'] for v in validators[:10]]) + """,
-                        backgroundColor: 'rgba(102, 126, 234, 0.6)',
-                        borderColor: 'rgba(102, 126, 234, 1)',
-                        borderWidth: 2
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: { display: false },
-                        title: {
-                            display: true,
-                            text: 'Top 10 Validators by Blocks Proposed'
-                        }
-                    },
-                    scales: {
-                        y: { beginAtZero: true }
-                    }
-                }
-            });
+            function escapeHtml(value) {{
+                return String(value).replace(/[&<>"']/g, c => ({{'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}})[c]);
+            }}
             
-            // Reward Distribution Chart
-            const rewardCtx = document.getElementById('rewardChart').getContext('2d');
-            new Chart(rewardCtx, {
-                type: 'doughnut',
-                data: {
-                    labels: ['Distributed', 'Remaining'],
-                    datasets: [{
-                        data: [""" + str(ledger.total_emitted_pals / config.PALS_PER_TMPL) + """, """ + str((config.MAX_SUPPLY_PALS - ledger.total_emitted_pals) / config.PALS_PER_TMPL) + """],
-                        backgroundColor: [
-                            'rgba(16, 185, 129, 0.6)',
-                            'rgba(107, 114, 128, 0.3)'
-                        ],
-                        borderColor: [
-                            'rgba(16, 185, 129, 1)',
-                            'rgba(107, 114, 128, 1)'
-                        ],
-                        borderWidth: 2
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: { position: 'bottom' },
-                        title: {
-                            display: true,
-                            text: 'Total Supply Distribution (""" + config.SYMBOL + """)'
-                        },
-                        tooltip: {
-                            callbacks: {
-                                label: function(context) {
-                                    let label = context.label || '';
-                                    if (label) {
-                                        label += ': ';
-                                    }
-                                    label += context.parsed.toLocaleString() + ' """ + config.SYMBOL + """';
-                                    return label;
-                                }
-                            }
-                        }
-                    }
-                }
-            });
+            function renderLeaderboard(validators) {{
+                const medals = ['🥇', '🥈', '🥉'];
+                document.getElementById('leaderboard-rows').innerHTML = validators.map((v, i) => `
+                    <tr>
+                        <td>${{i < 3 ? medals[i] : (i + 1) + '.'}}</td>
+                        <td><span class="monospace">${{escapeHtml(v.address.slice(0, 20))}}...</span></td>
+                        <td><span class="badge ${{v.status === 'active' ? 'badge-success' : 'badge-secondary'}}">${{v.status.toUpperCase()}}</span></td>
+                        <td><strong>${{v.blocks_proposed}}</strong></td>
+                        <td>${{escapeHtml(v.total_rewards_tmpl)}}</td>
+                        <td>${{escapeHtml(v.balance_tmpl)}}</td>
+                        <td><span class="monospace">${{escapeHtml(v.device_id_preview)}}</span></td>
+                    </tr>`).join('');
+            }}
+            
+            function renderCharts(data) {{
+                // Block Proposal Distribution Chart
+                const proposalCtx = document.getElementById('proposalChart').getContext('2d');
+                new Chart(proposalCtx, {{
+                    type: 'bar',
+                    data: {{
+                        labels: data.top10.labels,
+                        datasets: [{{
+                            label: 'Blocks Proposed',
+                            data: data.top10.blocks_proposed,
+                            backgroundColor: 'rgba(102, 126, 234, 0.6)',
+                            borderColor: 'rgba(102, 126, 234, 1)',
+                            borderWidth: 2
+                        }}]
+                    }},
+                    options: {{
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {{
+                            legend: {{ display: false }},
+                            title: {{
+                                display: true,
+                                text: 'Top 10 Validators by Blocks Proposed'
+                            }}
+                        }},
+                        scales: {{
+                            y: {{ beginAtZero: true }}
+                        }}
+                    }}
+                }});
+                
+                // Reward Distribution Chart
+                const rewardCtx = document.getElementById('rewardChart').getContext('2d');
+                new Chart(rewardCtx, {{
+                    type: 'doughnut',
+                    data: {{
+                        labels: ['Distributed', 'Remaining'],
+                        datasets: [{{
+                            data: [data.supply.emitted, data.supply.remaining],
+                            backgroundColor: [
+                                'rgba(16, 185, 129, 0.6)',
+                                'rgba(107, 114, 128, 0.3)'
+                            ],
+                            borderColor: [
+                                'rgba(16, 185, 129, 1)',
+                                'rgba(107, 114, 128, 1)'
+                            ],
+                            borderWidth: 2
+                        }}]
+                    }},
+                    options: {{
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {{
+                            legend: {{ position: 'bottom' }},
+                            title: {{
+                                display: true,
+                                text: 'Total Supply Distribution ({config.SYMBOL})'
+                            }},
+                            tooltip: {{
+                                callbacks: {{
+                                    label: function(context) {{
+                                        let label = context.label || '';
+                                        if (label) {{
+                                            label += ': ';
+                                        }}
+                                        label += context.parsed.toLocaleString() + ' {config.SYMBOL}';
+                                        return label;
+                                    }}
+                                }}
+                            }}
+                        }}
+                    }}
+                }});
+            }}
+            
+            fetch('/api/validators-dashboard.json')
+                .then(response => {{
+                    if (!response.ok) throw new Error('HTTP ' + response.status);
+                    return response.json();
+                }})
+                .then(data => {{
+                    document.getElementById('live-validator-count').textContent = data.stats.total_validators;
+                    document.getElementById('active-validator-count').textContent = data.stats.active_validators;
+                    document.getElementById('total-blocks-proposed').textContent = data.stats.total_blocks_proposed;
+                    renderLeaderboard(data.validators);
+                    renderCharts(data);
+                }})
+                .catch(error => {{
+                    document.getElementById('leaderboard-rows').innerHTML =
+                        '<tr><td colspan="7" style="text-align: center; color: var(--text-secondary);">Could not load validators (' + escapeHtml(error.message) + ')</td></tr>';
+                }});
         </script>
     </body>
     </html>
-    """
-    
-    return html
+    """)
+_VALIDATORS_DASHBOARD_HTML_GZ = gzip.compress(_VALIDATORS_DASHBOARD_HTML.encode(), compresslevel=9)
+_VALIDATORS_DASHBOARD_ETAG = _make_etag(_VALIDATORS_DASHBOARD_HTML)
 
 
-@app.get("/analytics", response_class=HTMLResponse)
+@app.get("/validators-dashboard", response_class=HTMLResponse)
 @limiter.limit("20/minute")
-async def analytics(request: Request):
-    """Analytics page with interactive charts and blockchain metrics"""
+async def validators_dashboard(request: Request):
+    """Enhanced validator dashboard with detailed stats and leaderboard (static shell, data from the JSON API)"""
+    return precompressed_response(
+        request, _VALIDATORS_DASHBOARD_HTML, _VALIDATORS_DASHBOARD_HTML_GZ, _VALIDATORS_DASHBOARD_ETAG
+    )
+
+
+@app.get("/api/validators-dashboard.json")
+@limiter.limit("20/minute")
+async def api_validators_dashboard(request: Request):
+    """
+    API endpoint: validator leaderboard, summary stats and chart data for /validators-dashboard
+    
+    Returns:
+        JSON with validators (ranked by blocks proposed), stats, top10 and supply
+    """
     ledger = get_ledger()
-    latest_block = ledger.get_latest_block()
+    tip = get_chain_tip(ledger)
+    cached = _page_cache.get("validators-dashboard.json")
+    if cached and cached[0] == tip:
+        return Response(content=cached[1], media_type="application/json")
     
-    # Calculate supply curve data (last 100 blocks or all if less)
-    block_heights = []
-    supply_at_height = []
-    tx_counts = []
-    
-    total_supply_so_far = 0
-    for block in ledger.blocks[-100:]:
-        block_heights.append(block.height)
-        total_supply_so_far += block.reward
-        supply_at_height.append(total_supply_so_far / config.PALS_PER_TMPL)
-        # Count only transfer transactions (exclude heartbeats and registrations)
-        transfer_count = sum(1 for tx in block.transactions if tx.tx_type == "transfer")
-        tx_counts.append(transfer_count)
+    validators = []
     
-    # Validator growth over time (count only registered validators)
-    validator_counts = []
-    for block in ledger.blocks:
-        # Count unique REGISTERED validators up to this block height
-        # Only count validators that are in the validator_registry and were registered by this block
-        validators_at_height = set()
-        for address, validator_data in ledger.validator_registry.items():
-            info = ledger.get_validator_info(address)
-            if info and info.get('registered_at', 0) <= block.timestamp:
-                validators_at_height.add(address)
-        validator_counts.append(len(validators_at_height))
+    current_height = ledger.head_height
     
-    html = f"""
+    cached_validator_stats = get_cached_validator_stats(ledger)
+    
+    for address, (info, balance) in ledger.snapshot_validators().items():
+        if info:
+            stats = cached_validator_stats.get(address, {
+                'blocks_proposed': 0,
+                'total_rewards': 0,
+                'last_block_height': -1
+            })
+            
+            block_count = stats['blocks_proposed']
+            total_rewards = stats['total_rewards']
+            display_status = get_display_status(stats['last_block_height'], current_height)
+            
+            validators.append({
+                "address": address,
+                "public_key": info.get('public_key', 'N/A')[:64] + '...',
+                "balance": balance,
+                "balance_tmpl": format_pals(balance),
+                "blocks_proposed": block_count,
+                "total_rewards": total_rewards,
+                "total_rewards_tmpl": format_pals(total_rewards),
+                "status": display_status,
+                "registered_at": info.get('registered_at', 0),
+                "device_id_preview": _device_id_preview(info)
+            })
+    
+    validators.sort(key=itemgetter('blocks_proposed'), reverse=True)
+    
+    # Top-10 proposal chart data
+    top_validators = validators[:10]
+    
+    body = json_dumps({
+        "validators": validators,
+        "stats": {
+            "total_validators": len(validators),
+            "active_validators": sum(1 for v in validators if v['status'] == 'active'),
+            "total_blocks_proposed": sum(v['blocks_proposed'] for v in validators)
+        },
+        "top10": {
+            "labels": [f"#{rank}" for rank in range(1, len(top_validators) + 1)],
+            "blocks_proposed": [v['blocks_proposed'] for v in top_validators]
+        },
+        "supply": {
+            "emitted": ledger.total_emitted_pals / config.PALS_PER_TMPL,
+            "remaining": (config.MAX_SUPPLY_PALS - ledger.total_emitted_pals) / config.PALS_PER_TMPL
+        }
+    })
+    
+    _page_cache["validators-dashboard.json"] = (tip, body)
+    return Response(content=body, media_type="application/json")
+
+
+# /analytics markup, filled per chain tip with str.format_map(): the page-wide
+# assets are rendered once here, so each new block only formats the data.
+_ANALYTICS_PAGE_TMPL = """
     <!DOCTYPE html>
     <html>
     <head>
+        <meta charset="UTF-8">
         <title>TIMPAL Analytics</title>
-        {get_base_styles()}
-        {get_chart_js_cdn()}
-        {get_theme_toggle_script()}
-        {get_live_updates_script()}
+        {head_assets}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
@@ -2151,26 +2667,26 @@ async def analytics(request: Request):
             <p><span class="live-indicator"></span> Real-time blockchain metrics and visualization</p>
         </div>
         
-        {get_navigation_html("analytics")}
+        {navigation}
         
         <div class="stats">
             <div class="stat-card">
                 <div class="stat-label">Latest Block</div>
-                <div class="stat-value" id="live-block-height">#{latest_block.height if latest_block else 0}</div>
+                <div class="stat-value" id="live-block-height">#{latest_height}</div>
             </div>
             <div class="stat-card">
                 <div class="stat-label">Total Supply</div>
-                <div class="stat-value" id="live-total-supply">{format_pals(ledger.total_emitted_pals)}</div>
-                <div class="stat-trend">{(ledger.total_emitted_pals / config.MAX_SUPPLY_PALS * 100):.2f}% mined</div>
+                <div class="stat-value" id="live-total-supply">{total_supply}</div>
+                <div class="stat-trend">{mined_pct:.2f}% mined</div>
             </div>
             <div class="stat-card">
                 <div class="stat-label">Validators</div>
-                <div class="stat-value" id="live-validator-count">{ledger.get_validator_count()}</div>
+                <div class="stat-value" id="live-validator-count">{validator_count}</div>
                 <div class="stat-trend">🌐 Decentralized</div>
             </div>
             <div class="stat-card">
-                <div class="stat-label">{config.SYMBOL} Transfers</div>
-                <div class="stat-value" id="live-tx-count">{sum(1 for b in ledger.blocks for tx in b.transactions if tx.tx_type == "transfer")}</div>
+                <div class="stat-label">{symbol} Transfers</div>
+                <div class="stat-value" id="live-tx-count">{transfer_count}</div>
             </div>
         </div>
         
@@ -2192,7 +2708,7 @@ async def analytics(request: Request):
         
         <div class="grid-2">
             <div class="card">
-                <h2>📦 {config.SYMBOL} Transfer Volume</h2>
+                <h2>📦 {symbol} Transfer Volume</h2>
                 <div class="chart-container">
                     <canvas id="txVolumeChart"></canvas>
                 </div>
@@ -2212,10 +2728,10 @@ async def analytics(request: Request):
             new Chart(supplyCtx, {{
                 type: 'line',
                 data: {{
-                    labels: {json.dumps(block_heights)},
+                    labels: {block_heights_json},
                     datasets: [{{
-                        label: 'Total Supply ({config.SYMBOL})',
-                        data: {json.dumps(supply_at_height)},
+                        label: 'Total Supply ({symbol})',
+                        data: {supply_json},
                         borderColor: 'rgba(102, 126, 234, 1)',
                         backgroundColor: 'rgba(102, 126, 234, 0.1)',
                         fill: true,
@@ -2229,13 +2745,13 @@ async def analytics(request: Request):
                         legend: {{ display: true, position: 'top' }},
                         title: {{
                             display: true,
-                            text: '{config.SYMBOL} Supply Growth Over Time'
+                            text: '{symbol} Supply Growth Over Time'
                         }}
                     }},
                     scales: {{
                         x: {{ title: {{ display: true, text: 'Block Height' }} }},
                         y: {{ 
-                            title: {{ display: true, text: 'Supply ({config.SYMBOL})' }},
+                            title: {{ display: true, text: 'Supply ({symbol})' }},
                             beginAtZero: true
                         }}
                     }}
@@ -2247,10 +2763,10 @@ async def analytics(request: Request):
             new Chart(validatorGrowthCtx, {{
                 type: 'line',
                 data: {{
-                    labels: {json.dumps(list(range(len(validator_counts))))},
+                    labels: {validator_labels_json},
                     datasets: [{{
                         label: 'Unique Validators',
-                        data: {json.dumps(validator_counts)},
+                        data: {validator_counts_json},
                         borderColor: 'rgba(16, 185, 129, 1)',
                         backgroundColor: 'rgba(16, 185, 129, 0.1)',
                         fill: true,
@@ -2283,10 +2799,10 @@ async def analytics(request: Request):
             new Chart(txVolumeCtx, {{
                 type: 'bar',
                 data: {{
-                    labels: {json.dumps(block_heights)},
+                    labels: {block_heights_json},
                     datasets: [{{
                         label: 'Transactions per Block',
-                        data: {json.dumps(tx_counts)},
+                        data: {tx_counts_json},
                         backgroundColor: 'rgba(245, 158, 11, 0.6)',
                         borderColor: 'rgba(245, 158, 11, 1)',
                         borderWidth: 1
@@ -2314,10 +2830,10 @@ async def analytics(request: Request):
             
             // Emission Schedule Chart
             const emissionCtx = document.getElementById('emissionChart').getContext('2d');
-            const phase1Blocks = {config.PHASE1_BLOCKS};
-            const currentBlock = {latest_block.height if latest_block else 0};
+            const phase1Blocks = {phase1_blocks};
+            const currentBlock = {latest_height};
             const blocksRemaining = Math.max(0, phase1Blocks - currentBlock);
-            const yearsRemaining = (blocksRemaining * {config.BLOCK_TIME}) / (365.25 * 24 * 3600);
+            const yearsRemaining = (blocksRemaining * {block_time}) / (365.25 * 24 * 3600);
             
             new Chart(emissionCtx, {{
                 type: 'doughnut',
@@ -2352,7 +2868,59 @@ async def analytics(request: Request):
     </body>
     </html>
     """
+_ANALYTICS_STATIC_CONTEXT = {
+    "head_assets": CDN_PRECONNECT + BASE_STYLES + CHART_JS_CDN + THEME_TOGGLE_SCRIPT + LIVE_UPDATES_SCRIPT,
+    "navigation": NAV_HTML["analytics"],
+    "symbol": config.SYMBOL,
+    "phase1_blocks": config.PHASE1_BLOCKS,
+    "block_time": config.BLOCK_TIME,
+}
+
+
+@app.get("/analytics", response_class=HTMLResponse)
+@limiter.limit("20/minute")
+async def analytics(request: Request):
+    """Analytics page with interactive charts and blockchain metrics"""
+    ledger = get_ledger()
+    tip = get_chain_tip(ledger)
+    cached = _page_cache.get("analytics")
+    if cached and cached[0] == tip:
+        return cached[1]
+    
+    latest_block = ledger.get_latest_block()
+    
+    # Calculate supply curve data (last 100 blocks or all if less)
+    recent_blocks = ledger.blocks[-100:]
+    block_heights = [block.height for block in recent_blocks]
+    supply_at_height = [supply / config.PALS_PER_TMPL for supply in ledger.get_cumulative_supply()[-100:]]
+    # Count only transfer transactions (exclude heartbeats and registrations)
+    tx_counts = [block.transfer_count for block in recent_blocks]
     
+    # Validator growth over time (count only registered validators)
+    # Count REGISTERED validators (in the validator_registry) that were registered by
+    # each block: sort the registration times once, then bisect per block
+    registration_times = sorted(
+        info.get('registered_at', 0)
+        for info, _balance in ledger.snapshot_validators().values()
+    )
+    validator_counts = [bisect.bisect_right(registration_times, block.timestamp) for block in ledger.blocks]
+    
+    latest_height = latest_block.height if latest_block else 0
+    html = _ANALYTICS_PAGE_TMPL.format_map({
+        **_ANALYTICS_STATIC_CONTEXT,
+        "latest_height": latest_height,
+        "total_supply": format_pals(ledger.total_emitted_pals),
+        "mined_pct": ledger.total_emitted_pals / config.MAX_SUPPLY_PALS * 100,
+        "validator_count": ledger.get_validator_count(),
+        "transfer_count": get_cached_stats(ledger)['transfer_count'],
+        "block_heights_json": json.dumps(block_heights),
+        "supply_json": json.dumps(supply_at_height),
+        "validator_labels_json": json.dumps(list(range(len(validator_counts)))),
+        "validator_counts_json": json.dumps(validator_counts),
+        "tx_counts_json": json.dumps(tx_counts),
+    })
+    
+    _page_cache["analytics"] = (tip, html)
     return html
 
 
@@ -2361,38 +2929,33 @@ async def analytics(request: Request):
 async def network_visualization(request: Request):
     """Network visualization page with interactive validator graph"""
     ledger = get_ledger()
+    tip = get_chain_tip(ledger)
+    cached = _page_cache.get("network")
+    if cached and cached[0] == tip:
+        return cached[1]
     
     # Build network graph data
     validators = []
     edges = []
     
     # Get current height for liveness detection (same logic as leaderboard)
-    current_height = ledger.get_block_count() - 1
-    LIVENESS_WINDOW = 30  # ~90 seconds at 3s/block - proof of activity window
+    current_height = ledger.head_height
     
-    for idx, (address, validator_data) in enumerate(ledger.validator_registry.items()):
-        info = ledger.get_validator_info(address)
-        if info:
-            block_count = sum(1 for block in ledger.blocks if block.proposer == address)
+    # Proposer counts and last proposed heights come from the single-pass,
+    # height-cached validator stats instead of two chain scans per validator
+    cached_validator_stats = get_cached_validator_stats(ledger)
+    
+    for address, validator_data in ledger.validator_registry.items():
+        if validator_data is not None:
+            stats = cached_validator_stats.get(address)
+            block_count = stats['blocks_proposed'] if stats else 0
             
             # LIVENESS DETECTION: Check if validator proposed a block recently
-            # Find the most recent block proposed by this validator
-            last_block_height = -1
-            for block in reversed(ledger.blocks):
-                if block.proposer == address:
-                    last_block_height = block.height
-                    break
+            # (height of the most recent block proposed by this validator)
+            last_block_height = stats['last_block_height'] if stats else -1
             
             # Determine real-time online/offline status (same as leaderboard)
-            if current_height < 10:
-                # Bootstrap period - all registered validators shown as active
-                display_status = "active"
-            elif last_block_height >= 0 and (current_height - last_block_height) <= LIVENESS_WINDOW:
-                # Proposed a block recently - ONLINE
-                display_status = "active"
-            else:
-                # No recent blocks - OFFLINE
-                display_status = "offline"
+            display_status = get_display_status(last_block_height, current_height)
             
             # FILTER: Only show ACTIVE validators in network graph
             if display_status == "active":
@@ -2405,23 +2968,30 @@ async def network_visualization(request: Request):
                 })
     
     # Create edges between validators (representing block proposals)
-    # Connect each validator to the next proposer
-    # Only include edges between ACTIVE validators
+    # Connect each validator to the next proposer over the recent blocks
+    # Only include edges between ACTIVE validators; repeated hand-offs between
+    # the same pair are drawn as one edge weighted by how often they occurred
     active_addresses = {v["id"] for v in validators}
-    for i in range(len(ledger.blocks) - 1):
-        from_addr = ledger.blocks[i].proposer
-        to_addr = ledger.blocks[i + 1].proposer
+    recent_blocks = ledger.blocks[-NETWORK_EDGE_BLOCKS:]
+    edge_counts: Dict[Tuple[str, str], int] = {}
+    for from_block, to_block in zip(recent_blocks, recent_blocks[1:]):
+        from_addr = from_block.proposer
+        to_addr = to_block.proposer
         if from_addr != to_addr and from_addr in active_addresses and to_addr in active_addresses:
-            edges.append({"from": from_addr, "to": to_addr})
+            edge_counts[(from_addr, to_addr)] = edge_counts.get((from_addr, to_addr), 0) + 1
+    for (from_addr, to_addr), count in edge_counts.items():
+        edges.append({"from": from_addr, "to": to_addr, "value": count, "title": f"{count} hand-offs"})
     
     html = f"""
     <!DOCTYPE html>
     <html>
     <head>
+        <meta charset="UTF-8">
+        {CDN_PRECONNECT}
         <title>TIMPAL Network Visualization</title>
-        {get_base_styles()}
-        {get_vis_js_cdn()}
-        {get_theme_toggle_script()}
+        {BASE_STYLES}
+        {VIS_JS_CDN}
+        {THEME_TOGGLE_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
@@ -2431,13 +3001,13 @@ async def network_visualization(request: Request):
             <p>Interactive validator network graph - real-time topology</p>
         </div>
         
-        {get_navigation_html("network")}
+        {NAV_HTML["network"]}
         
         <div class="card">
             <h2>🔗 Validator Network Graph</h2>
             <p style="color: var(--text-secondary);">
                 Node size represents blocks proposed. Green = active, Gray = inactive. 
-                Edges show block proposal sequence.
+                Edges show block proposal sequence over the last {NETWORK_EDGE_BLOCKS:,} blocks (thicker = more hand-offs).
             </p>
             <div class="network-container" id="networkContainer"></div>
         </div>
@@ -2478,23 +3048,28 @@ async def network_visualization(request: Request):
                         color: '#333'
                     }},
                     borderWidth: 2,
-                    shadow: true
+                    shadow: false
                 }},
                 edges: {{
-                    width: 1,
+                    scaling: {{ min: 1, max: 6 }},
                     color: {{ color: '#cccccc', opacity: 0.5 }},
-                    smooth: {{ type: 'continuous' }},
+                    smooth: false,
                     arrows: {{ to: {{ enabled: true, scaleFactor: 0.5 }} }}
                 }},
                 physics: {{
                     enabled: true,
+                    adaptiveTimestep: true,
+                    minVelocity: 0.75,
                     barnesHut: {{
+                        theta: 0.8,
                         gravitationalConstant: -8000,
                         springConstant: 0.001,
                         springLength: 200
                     }},
                     stabilization: {{
-                        iterations: 150
+                        iterations: 50,
+                        updateInterval: 25,
+                        fit: true
                     }}
                 }},
                 interaction: {{
@@ -2506,7 +3081,29 @@ async def network_visualization(request: Request):
             }};
             
             // Create network
-            const network = new vis.Network(container, {{ nodes: nodes, edges: edges }}, options);
+            const network = new vis.Network(container, {{}}, options);
+            
+            // Let the Barnes-Hut solver reuse its quadtree for a few physics ticks
+            // instead of rebuilding it on every tick (forces stay approximate, as with
+            // d3-force-reuse); patched before the data is loaded so stabilization uses it
+            const BARNES_HUT_REUSE_INTERVAL = 5;
+            const solver = network.physics && network.physics.nodesSolver;
+            const solverProto = solver && Object.getPrototypeOf(solver);
+            if (solverProto && solverProto._formBarnesHutTree && !solverProto._formBarnesHutTreeFresh) {{
+                solverProto._formBarnesHutTreeFresh = solverProto._formBarnesHutTree;
+                solverProto._formBarnesHutTree = function(bodyNodes, nodeIndices) {{
+                    if (this._reusedTree && this._reusedTreeSize === nodeIndices.length
+                            && this._reusedTreeAge < BARNES_HUT_REUSE_INTERVAL) {{
+                        this._reusedTreeAge++;
+                        return this._reusedTree;
+                    }}
+                    this._reusedTree = this._formBarnesHutTreeFresh(bodyNodes, nodeIndices);
+                    this._reusedTreeSize = nodeIndices.length;
+                    this._reusedTreeAge = 1;
+                    return this._reusedTree;
+                }};
+            }}
+            network.setData({{ nodes: nodes, edges: edges }});
             
             // Event handlers
             network.on('click', function(params) {{
@@ -2524,20 +3121,20 @@ async def network_visualization(request: Request):
     </html>
     """
     
+    _page_cache["network"] = (tip, html)
     return html
 
 
-@app.get("/api-docs", response_class=HTMLResponse)
-@limiter.limit("30/minute")
-async def api_documentation(request: Request):
-    """API documentation page with examples"""
-    html = f"""
+# The API documentation has no per-request data, so it is rendered and gzipped
+# once at import (not minified: the <pre> examples depend on their indentation).
+_API_DOCS_HTML = f"""
     <!DOCTYPE html>
     <html>
     <head>
+        <meta charset="UTF-8">
         <title>TIMPAL API Documentation</title>
-        {get_base_styles()}
-        {get_theme_toggle_script()}
+        {BASE_STYLES}
+        {THEME_TOGGLE_SCRIPT}
     </head>
     <body>
         <button class="theme-toggle" onclick="toggleTheme()">🌓</button>
@@ -2547,7 +3144,7 @@ async def api_documentation(request: Request):
             <p>RESTful JSON API for blockchain data access</p>
         </div>
         
-        {get_navigation_html("api")}
+        {NAV_HTML["api"]}
         
         <div class="card">
             <h2>🚀 Getting Started</h2>
@@ -2800,14 +3397,33 @@ curl http://localhost:8080/search/tmpl6065afd538da959a3600d5cf9f0b8b1c74c2e8e519
     </body>
     </html>
     """
-    
-    return html
+_API_DOCS_HTML_GZ = gzip.compress(_API_DOCS_HTML.encode(), compresslevel=9)
+_API_DOCS_ETAG = _make_etag(_API_DOCS_HTML)
+
+
+@app.get("/api-docs", response_class=HTMLResponse)
+@limiter.limit("30/minute")
+async def api_documentation(request: Request):
+    """API documentation page with examples"""
+    return precompressed_response(request, _API_DOCS_HTML, _API_DOCS_HTML_GZ, _API_DOCS_ETAG)
 
 
 # =============================================================================
 # DEBUG ENDPOINTS - Observability for liveness, proposers, and rewards
 # =============================================================================
 
+def _cached_debug_payload(name: str, build: Callable[[Ledger], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a debug payload, rebuilt only when the chain tip changes (the timestamp is always current)"""
+    ledger = get_ledger()
+    tip = get_chain_tip(ledger)
+    cached = _debug_cache.get(name)
+    if cached is None or cached[0] != tip:
+        cached = _debug_cache[name] = (tip, build(ledger))
+    payload = dict(cached[1])
+    payload["timestamp"] = time.time()
+    return payload
+
+
 @app.get("/debug/liveness")
 @limiter.limit("60/minute")
 async def debug_liveness(request: Request):
@@ -2823,8 +3439,12 @@ async def debug_liveness(request: Request):
         - last_proposed_height: Last block height proposed by this validator
         - last_reward_height: Last block height where validator received rewards
     """
-    ledger = get_ledger()
-    current_height = ledger.get_block_count() - 1
+    return _cached_debug_payload("liveness", _debug_liveness_payload)
+
+
+def _debug_liveness_payload(ledger: Ledger) -> Dict[str, Any]:
+    """Build the /debug/liveness payload for the current chain tip"""
+    current_height = ledger.head_height
     
     # Get all validators from registry
     validators_liveness = {}
@@ -2848,24 +3468,13 @@ async def debug_liveness(request: Request):
         # Check if excluded from rewards (10-block cutoff)
         is_offline_for_rewards = ledger.is_validator_offline_for_rewards(addr, current_height)
         
-        # Find last proposed block
-        last_proposed_height = -1
-        last_reward_height = -1
-        for block in reversed(ledger.blocks):
-            if last_proposed_height == -1 and block.proposer == addr:
-                last_proposed_height = block.height
-            if last_reward_height == -1 and block.reward_allocations and addr in block.reward_allocations:
-                last_reward_height = block.height
-            if last_proposed_height != -1 and last_reward_height != -1:
-                break
-        
         validators_liveness[addr] = {
             "status": data.get('status', 'unknown'),
             "offline_since_height": offline_since_height,
             "blocks_offline": blocks_offline,
             "is_offline_for_rewards": is_offline_for_rewards,
-            "last_proposed_height": last_proposed_height,
-            "last_reward_height": last_reward_height,
+            "last_proposed_height": ledger.get_last_proposed(addr),
+            "last_reward_height": ledger.get_last_reward_height(addr),
             "activation_height": data.get('activation_height'),
             "public_key": data.get('public_key', '')[:20] + '...' if data.get('public_key') else None
         }
@@ -2923,6 +3532,37 @@ async def debug_proposers(request: Request):
     # Determine if single-validator mode would be active
     is_single_validator_mode = len(ranked_proposers) == 1
     
+    history = _cached_debug_payload("proposers", _debug_proposer_history)
+    
+    return {
+        "current_height": current_height,
+        "timestamp": current_time,
+        "genesis_timestamp": genesis_timestamp,
+        "block_time": config.BLOCK_TIME,
+        "window_seconds": WINDOW_SECONDS if 'WINDOW_SECONDS' in dir() else 1.0,
+        "slot_info": {
+            "current_slot": current_slot,
+            "active_rank": active_rank,
+            "latest_block_slot": getattr(latest_block, 'slot', None) if latest_block else None
+        },
+        "proposer_selection": {
+            "ranked_proposers": ranked_proposers,
+            "is_single_validator_mode": is_single_validator_mode,
+            "validator_set_size": history["validator_set_size"]
+        },
+        "recent_proposers": history["recent_proposers"],
+        "fallback_events": history["fallback_events"],
+        "timing": {
+            "time_since_genesis": current_time - genesis_timestamp,
+            "expected_blocks": int((current_time - genesis_timestamp) / config.BLOCK_TIME),
+            "actual_blocks": current_height + 1,
+            "blocks_behind": max(0, int((current_time - genesis_timestamp) / config.BLOCK_TIME) - (current_height + 1))
+        }
+    }
+
+
+def _debug_proposer_history(ledger: Ledger) -> Dict[str, Any]:
+    """Chain-derived part of /debug/proposers (recent proposers, fallbacks, validator set size)"""
     # Get recent proposers (last 20 blocks)
     recent_proposers = []
     for block in ledger.blocks[-20:]:
@@ -2935,11 +3575,9 @@ async def debug_proposers(request: Request):
     
     # Detect fallback events (when proposer rank > 0)
     fallback_events = []
-    for i, block in enumerate(ledger.blocks[-50:]):
-        if i == 0:
-            continue
-        prev_block = ledger.blocks[-(50-i+1)] if len(ledger.blocks) > 50-i+1 else None
-        if prev_block and block.slot and prev_block.slot:
+    window = ledger.blocks[-50:]
+    for prev_block, block in zip(window, window[1:]):
+        if block.slot and prev_block.slot:
             # If same slot but different proposer, it's a fallback
             if block.slot == prev_block.slot:
                 fallback_events.append({
@@ -2953,29 +3591,9 @@ async def debug_proposers(request: Request):
     validator_set = ledger.get_validator_set()
     
     return {
-        "current_height": current_height,
-        "timestamp": current_time,
-        "genesis_timestamp": genesis_timestamp,
-        "block_time": config.BLOCK_TIME,
-        "window_seconds": WINDOW_SECONDS if 'WINDOW_SECONDS' in dir() else 1.0,
-        "slot_info": {
-            "current_slot": current_slot,
-            "active_rank": active_rank,
-            "latest_block_slot": getattr(latest_block, 'slot', None) if latest_block else None
-        },
-        "proposer_selection": {
-            "ranked_proposers": ranked_proposers,
-            "is_single_validator_mode": is_single_validator_mode,
-            "validator_set_size": len(validator_set)
-        },
         "recent_proposers": recent_proposers,
         "fallback_events": fallback_events[-10:],  # Last 10 fallback events
-        "timing": {
-            "time_since_genesis": current_time - genesis_timestamp,
-            "expected_blocks": int((current_time - genesis_timestamp) / config.BLOCK_TIME),
-            "actual_blocks": current_height + 1,
-            "blocks_behind": max(0, int((current_time - genesis_timestamp) / config.BLOCK_TIME) - (current_height + 1))
-        }
+        "validator_set_size": len(validator_set)
     }
 
 
@@ -2992,11 +3610,16 @@ async def debug_rewards(request: Request):
         - recent_rewards: Last N blocks' reward distributions
         - reward_sources: How validators qualified for rewards (proposer, attestation, etc.)
     """
-    ledger = get_ledger()
-    current_height = ledger.get_block_count() - 1
+    return _cached_debug_payload("rewards", _debug_rewards_payload)
+
+
+def _debug_rewards_payload(ledger: Ledger) -> Dict[str, Any]:
+    """Build the /debug/rewards payload for the current chain tip"""
+    current_height = ledger.head_height
     
     # Get online validators (deterministic)
     rewardable_validators = ledger.get_online_validators_deterministic(current_height)
+    rewardable_set = set(rewardable_validators)
     
     # Get all validators and determine exclusion reasons
     excluded_validators = []
@@ -3006,7 +3629,7 @@ async def debug_rewards(request: Request):
         if not isinstance(data, dict):
             continue
         
-        if addr not in rewardable_validators:
+        if addr not in rewardable_set:
             # Determine exclusion reason
             reasons = []
             
@@ -3050,16 +3673,16 @@ async def debug_rewards(request: Request):
     # Calculate reward sources for each rewardable validator
     reward_sources = {}
     proposer_lookback = max(30, len(rewardable_validators) * 2)
-    recent_proposers = set()
-    for block in ledger.blocks[-proposer_lookback:]:
-        if block.proposer:
-            recent_proposers.add(block.proposer)
+    # A validator is a recent proposer if its last proposal is inside the lookback window
+    # (read from the ledger's proposer index rather than slicing the window every call)
+    recent_proposer_cutoff = current_height - proposer_lookback
     
-    validators_with_attestations = ledger.get_validators_with_recent_attestations(lookback_blocks=100)
+    # Membership set: the ledger returns a sorted list outside the bootstrap period
+    validators_with_attestations = set(ledger.get_validators_with_recent_attestations(lookback_blocks=100))
     
     for addr in rewardable_validators:
         sources = []
-        if addr in recent_proposers:
+        if ledger.get_last_proposed(addr) > recent_proposer_cutoff:
             sources.append("recent_proposer")
         if addr in validators_with_attestations:
             sources.append("attestation")
@@ -3108,48 +3731,90 @@ async def api_health():
     }
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Run blockchain verification on startup using lifespan handler"""
-    import glob
+def _verify_chain_on_startup(data_dir: str) -> int:
+    """
+    Load the chain from data_dir and verify every block.
     
+    Returns:
+        Exit status for the verification process: 0 valid, 1 invalid, 2 could not verify
+    """
     print("🔍 Running blockchain integrity check...")
-    
-    data_dir = os.getenv("EXPLORER_DATA_DIR")
-    if not data_dir:
-        from pathlib import Path
-        
-        node_dirs = []
-        
-        # Check new default location: ~/.timpal/testnet_data_node_*/ledger
-        timpal_home = Path.home() / ".timpal"
-        if timpal_home.exists():
-            node_dirs.extend(glob.glob(str(timpal_home / "testnet_data_node_*/ledger")))
-        
-        # Also check legacy location: ./testnet_data_node_*/ledger (for backwards compatibility)
-        node_dirs.extend(glob.glob("testnet_data_node_*/ledger"))
-        
-        if node_dirs:
-            data_dir = sorted(node_dirs, key=lambda x: os.path.getmtime(x), reverse=True)[0]
-        else:
-            data_dir = str(Path.home() / ".timpal" / "testnet_data_node_9000" / "ledger")
-    
     try:
         ledger = Ledger(data_dir=data_dir, use_production_storage=False)
-        
-        if ledger.verify_chain():
-            print("✅ Blockchain integrity verified - all blocks valid")
-        else:
-            print("❌ WARNING: Blockchain integrity check failed!")
-        
+        valid = ledger.verify_chain()
         emitted_tmpl = ledger.total_emitted_pals / config.PALS_PER_TMPL
         print(f"📊 Loaded {len(ledger.blocks)} blocks, {emitted_tmpl:,.8f} {config.SYMBOL} emitted")
+        return 0 if valid else 1
     except Exception as e:
         print(f"⚠️  Could not verify blockchain: {e}")
+        return 2
+
+
+def _verify_chain_process(data_dir: str):
+    sys.exit(_verify_chain_on_startup(data_dir))
+
+
+async def _startup_verify(data_dir: str):
+    """
+    Verify the chain in the background and log the outcome.
+    
+    verify_chain is CPU-bound pure Python, so where fork is available it runs in a
+    child process instead of a thread that would hold the GIL while requests are
+    served. Cancelling the task terminates the child.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        process = multiprocessing.get_context("fork").Process(
+            target=_verify_chain_process, args=(data_dir,), daemon=True
+        )
+        process.start()
+        try:
+            while process.is_alive():
+                await asyncio.sleep(STARTUP_VERIFY_POLL_INTERVAL)
+        except asyncio.CancelledError:
+            process.terminate()
+            process.join()
+            raise
+        status = process.exitcode
+    else:
+        status = await asyncio.to_thread(_verify_chain_on_startup, data_dir)
+    
+    if status == 0:
+        print("✅ Blockchain integrity verified - all blocks valid")
+    elif status == 1:
+        print("❌ WARNING: Blockchain integrity check failed!")
+    else:
+        print(f"⚠️  Blockchain integrity check did not complete (status {status})")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start blockchain verification in the background and own the node API session"""
+    data_dir = _find_data_dir()
+    
+    app.state.startup_verify = None
+    if os.getenv("SKIP_STARTUP_VERIFY") == "1":
+        print("⏭️  Skipping blockchain integrity check (SKIP_STARTUP_VERIFY=1)")
+    else:
+        # The check only reports, so it runs in the background while the explorer starts serving
+        app.state.startup_verify = asyncio.create_task(_startup_verify(data_dir))
     
     print(f"🔒 Security: Rate limiting enabled, CORS restricted to localhost")
     print(f"⚡ Performance: Ledger caching enabled ({CACHE_TTL}s TTL), stats caching enabled")
-    yield
+    
+    # Shared keep-alive session for node API calls (reused across requests)
+    app.state.http = create_node_session()
+    get_submit_queue(app)
+    get_stream_condition(app)
+    try:
+        yield
+    finally:
+        app.state.submit_flusher.cancel()
+        app.state.stream_watcher.cancel()
+        if app.state.startup_verify is not None:
+            app.state.startup_verify.cancel()
+            with suppress(asyncio.CancelledError):
+                await app.state.startup_verify
+        await app.state.http.close()
 
 # Update app to use lifespan
 app.router.lifespan_context = lifespan
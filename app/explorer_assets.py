@@ -3,12 +3,15 @@ TIMPAL Block Explorer - Static Assets and UI Components
 Provides CSS, JavaScript, and HTML components for the enhanced explorer
 """
 
-def get_base_styles(theme="light"):
-    """Get base CSS styles with theme support"""
-    return f"""
-    <style>
+import hashlib
+import os
+import re
+
+# Stylesheet shared by every explorer page. Both themes live in the same sheet:
+# the dark palette applies through html[data-theme="dark"], set client-side.
+_BASE_CSS_TEMPLATE = """
         /* Light theme (default) */
-        :root {{
+        :root {
             --bg-color: #f5f5f5;
             --card-bg: #ffffff;
             --text-color: #333333;
@@ -16,12 +19,13 @@ def get_base_styles(theme="light"):
             --border-color: #e0e0e0;
             --gradient-start: #667eea;
             --gradient-end: #764ba2;
+            --brand-gradient: linear-gradient(135deg, var(--gradient-start) 0%, var(--gradient-end) 100%);
             --link-color: #2563eb;
             --link-hover: #1e40af;
-        }}
+        }
         
         /* Dark theme */
-        html[data-theme="dark"] {{
+        html[data-theme="dark"] {
             --bg-color: #1a1a1a;
             --card-bg: #2d2d2d;
             --text-color: #e0e0e0;
@@ -29,207 +33,234 @@ def get_base_styles(theme="light"):
             --border-color: #404040;
             --link-color: #60a5fa;
             --link-hover: #93c5fd;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
             max-width: 1400px;
             margin: 0 auto;
             padding: 20px;
             background: var(--bg-color);
             color: var(--text-color);
-            transition: all 0.3s ease;
-        }}
+            transition: background-color 0.3s ease, color 0.3s ease;
+        }
         
         /* General link styling that adapts to theme */
-        a {{
+        a {
             color: var(--link-color);
             text-decoration: none;
             transition: color 0.2s ease;
-        }}
+        }
         
-        a:hover {{
+        a:hover {
             color: var(--link-hover);
             text-decoration: underline;
-        }}
+        }
         
-        .header {{
-            background: linear-gradient(135deg, var(--gradient-start) 0%, var(--gradient-end) 100%);
+        .header {
+            background: var(--brand-gradient);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             margin: 0 0 10px 0;
             font-size: 2.5em;
-        }}
+        }
         
-        .header p {{
+        .header p {
             margin: 0;
             opacity: 0.9;
-        }}
+        }
         
-        .nav {{
+        .nav {
             display: flex;
             gap: 15px;
             margin-bottom: 30px;
             flex-wrap: wrap;
-        }}
+        }
         
-        .nav a {{
+        .nav a {
             color: var(--text-color);
             text-decoration: none;
             padding: 10px 20px;
             background: var(--card-bg);
             border-radius: 5px;
-            transition: all 0.2s;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .nav a:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }}
+        }
         
-        .nav a.active {{
-            background: linear-gradient(135deg, var(--gradient-start), var(--gradient-end));
+        .nav a.active {
+            background: var(--brand-gradient);
             color: white;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: var(--card-bg);
             padding: 20px;
             border-radius: 8px;
+        }
+        
+        /* Raised surfaces */
+        .nav a,
+        .stat-card,
+        .card,
+        .theme-toggle {
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: all 0.2s;
-        }}
+        }
         
-        .stat-card:hover {{
+        /* Lift on hover */
+        .nav a,
+        .stat-card {
+            transition: transform 0.2s;
+            position: relative;
+        }
+        
+        .nav a:hover,
+        .stat-card:hover {
             transform: translateY(-2px);
+        }
+        
+        /* Hover shadow is pre-rendered on a layer that only fades in, so hovering
+           animates compositor-only properties instead of repainting box-shadow */
+        .nav a::after,
+        .stat-card::after {
+            content: '';
+            position: absolute;
+            top: 0;
+            right: 0;
+            bottom: 0;
+            left: 0;
+            border-radius: inherit;
             box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }}
+            opacity: 0;
+            transition: opacity 0.2s;
+            pointer-events: none;
+        }
         
-        .stat-label {{
+        .nav a:hover::after,
+        .stat-card:hover::after {
+            opacity: 1;
+        }
+        
+        .stat-label {
             color: var(--text-secondary);
             font-size: 14px;
             margin-bottom: 5px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 24px;
             font-weight: bold;
             color: var(--text-color);
-        }}
+        }
         
-        .stat-trend {{
+        .stat-trend {
             font-size: 12px;
             color: #10b981;
             margin-top: 5px;
-        }}
+        }
         
-        .stat-trend.down {{
+        .stat-trend.down {
             color: #ef4444;
-        }}
+        }
         
-        .card {{
+        .card {
             background: var(--card-bg);
             padding: 20px;
             border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 20px;
-        }}
+        }
         
-        .card h2 {{
+        .card h2 {
             margin-top: 0;
             color: var(--text-color);
-        }}
+        }
         
-        .table {{
+        .table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 15px;
-        }}
+        }
         
-        .table th {{
+        .table th {
             background: var(--bg-color);
             padding: 12px;
             text-align: left;
             font-weight: 600;
             border-bottom: 2px solid var(--border-color);
-        }}
+        }
         
-        .table td {{
+        .table td {
             padding: 12px;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .table tr:hover {{
+        .table tr:hover {
             background: var(--bg-color);
-        }}
+        }
         
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 12px;
             font-weight: 600;
-        }}
+        }
         
-        .badge-success {{
+        .badge-success {
             background: #10b981;
             color: white;
-        }}
+        }
         
-        .badge-warning {{
+        .badge-warning {
             background: #f59e0b;
             color: white;
-        }}
+        }
         
-        .badge-info {{
+        .badge-info {
             background: #3b82f6;
             color: white;
-        }}
+        }
         
-        .badge-secondary {{
+        .badge-secondary {
             background: #6b7280;
             color: white;
-        }}
+        }
         
-        .monospace {{
+        .monospace {
             font-family: 'Courier New', monospace;
             background: var(--bg-color);
             padding: 2px 6px;
             border-radius: 3px;
             font-size: 0.9em;
-        }}
+        }
         
-        .chart-container {{
+        .chart-container {
             position: relative;
             height: 400px;
             margin: 20px 0;
-        }}
+        }
         
-        .network-container {{
+        .network-container {
             position: relative;
             height: 600px;
             border: 1px solid var(--border-color);
             border-radius: 8px;
             background: var(--card-bg);
-        }}
+        }
         
-        .theme-toggle {{
+        .theme-toggle {
             position: fixed;
             top: 20px;
             right: 20px;
@@ -238,31 +269,36 @@ def get_base_styles(theme="light"):
             padding: 10px 20px;
             border-radius: 5px;
             cursor: pointer;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             color: var(--text-color);
             font-size: 1.2em;
-            transition: all 0.2s;
-        }}
+            transition: transform 0.2s;
+        }
         
-        .theme-toggle:hover {{
+        .theme-toggle:hover {
             transform: scale(1.1);
-        }}
+        }
         
-        .live-indicator {{
+        .live-indicator {
             display: inline-block;
             width: 10px;
             height: 10px;
             background: #10b981;
             border-radius: 50%;
             animation: pulse 2s infinite;
-        }}
+        }
         
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 1; }}
-            50% {{ opacity: 0.5; }}
-        }}
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.5; }
+        }
         
-        .search-box {{
+        @media (prefers-reduced-motion: reduce) {
+            .live-indicator {
+                animation: none;
+            }
+        }
+        
+        .search-box {
             width: 100%;
             padding: 15px;
             border: 2px solid var(--border-color);
@@ -271,53 +307,57 @@ def get_base_styles(theme="light"):
             background: var(--card-bg);
             color: var(--text-color);
             margin-bottom: 20px;
-        }}
+        }
         
-        .search-box:focus {{
+        .search-box:focus {
             outline: none;
             border-color: var(--gradient-start);
-        }}
+        }
         
-        .grid-2 {{
+        .grid-2 {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
             gap: 20px;
             margin-bottom: 20px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .grid-2 {{
+        @media (max-width: 768px) {
+            .grid-2 {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .stats {{
+            .stats {
                 grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 1.8em;
-            }}
-        }}
-    </style>
+            }
+        }
     """
 
-def get_chart_js_cdn():
-    """Get Chart.js CDN links"""
-    return """
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    """
+def _minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
 
-def get_vis_js_cdn():
-    """Get Vis.js network CDN links"""
-    return """
-    <script src="https://cdn.jsdelivr.net/npm/vis-network@9.1.9/dist/vis-network.min.js"></script>
-    <link href="https://cdn.jsdelivr.net/npm/vis-network@9.1.9/dist/vis-network.min.css" rel="stylesheet">
-    """
+# Opens the connection to the CDN while the rest of <head> is still being fetched,
+# so pages using the CDN tags below emit it first, ahead of any stylesheet.
+# No crossorigin attribute: the script/stylesheet tags make credentialed
+# requests, which would not reuse an anonymous preconnected socket.
+CDN_PRECONNECT = '<link rel="preconnect" href="https://cdn.jsdelivr.net"><link rel="dns-prefetch" href="https://cdn.jsdelivr.net">'
+
+CHART_JS_CDN = '<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>'
 
-def get_theme_toggle_script():
-    """Get theme toggle JavaScript"""
-    return """
-    <script>
+VIS_JS_CDN = (
+    '<script src="https://cdn.jsdelivr.net/npm/vis-network@9.1.9/dist/vis-network.min.js"></script>'
+    '<link href="https://cdn.jsdelivr.net/npm/vis-network@9.1.9/dist/vis-network.min.css" rel="stylesheet">'
+)
+
+# Runs in <head> (a blocking script) so the saved theme applies before first paint
+_THEME_TOGGLE_JS = """
         // Apply theme immediately (before DOM loads to prevent flash)
         (function() {
             const theme = localStorage.getItem('theme') || 'light';
@@ -336,22 +376,56 @@ def get_theme_toggle_script():
         function getTheme() {
             return localStorage.getItem('theme') || 'light';
         }
-    </script>
-    """
+"""
 
-def get_live_updates_script():
-    """Get Server-Sent Events (SSE) JavaScript for real-time updates"""
-    return """
-    <script>
+_LIVE_UPDATES_JS = """
         let eventSource = null;
-        
-        function startLiveUpdates() {
+        let reconnectTimer = null;
+        let reconnectDelay = 1000;
+        const MAX_RECONNECT_DELAY = 30000;
+        
+        // After this many failed stream attempts in a row, /stats is polled until a
+        // stream opens again (conditional requests: unchanged stats answer 304)
+        const STREAM_FAILURES_BEFORE_POLLING = 5;
+        const POLL_INTERVAL = 5000;
+        let streamFailures = 0;
+        let pollTimer = null;
+        let statsEtag = null;
+        
+        function closeStream() {
+            clearTimeout(reconnectTimer);
+            reconnectTimer = null;
             if (eventSource) {
                 eventSource.close();
+                eventSource = null;
+            }
+        }
+        
+        function stopPolling() {
+            clearInterval(pollTimer);
+            pollTimer = null;
+        }
+        
+        function stopLiveUpdates() {
+            closeStream();
+            stopPolling();
+        }
+        
+        function startLiveUpdates() {
+            closeStream();
+            // Hidden tabs don't hold a stream open; visibilitychange restarts it
+            if (document.hidden) {
+                return;
             }
             
             eventSource = new EventSource('/stream');
             
+            eventSource.onopen = function() {
+                reconnectDelay = 1000;
+                streamFailures = 0;
+                stopPolling();
+            };
+            
             eventSource.onmessage = function(event) {
                 const data = JSON.parse(event.data);
                 updateStats(data);
@@ -359,65 +433,115 @@ def get_live_updates_script():
             
             eventSource.onerror = function(error) {
                 console.error('SSE Error:', error);
-                eventSource.close();
-                // Reconnect after 5 seconds
-                setTimeout(startLiveUpdates, 5000);
+                closeStream();
+                streamFailures++;
+                if (streamFailures >= STREAM_FAILURES_BEFORE_POLLING && !pollTimer) {
+                    pollStats();
+                    pollTimer = setInterval(pollStats, POLL_INTERVAL);
+                }
+                // Reconnect with exponential backoff (1s, 2s, 4s, ... up to 30s)
+                reconnectTimer = setTimeout(startLiveUpdates, reconnectDelay);
+                reconnectDelay = Math.min(reconnectDelay * 2, MAX_RECONNECT_DELAY);
             };
         }
         
+        async function pollStats() {
+            try {
+                const response = await fetch('/stats', {
+                    headers: statsEtag ? {'If-None-Match': statsEtag} : {}
+                });
+                if (response.status !== 200) {
+                    return;
+                }
+                statsEtag = response.headers.get('ETag');
+                const stats = await response.json();
+                updateStats({
+                    latest_block: stats.chain_height,
+                    total_supply_tmpl: stats.total_supply_tmpl,
+                    validator_count: stats.validator_count,
+                    total_transactions: stats.total_transactions
+                });
+            } catch (error) {
+                console.error('Stats poll error:', error);
+            }
+        }
+        
+        // Stat fields fed by the stream: [payload key, element id, prefix]
+        const LIVE_FIELDS = [
+            ['latest_block', 'live-block-height', '#'],
+            ['total_supply_tmpl', 'live-total-supply', ''],
+            ['validator_count', 'live-validator-count', ''],
+            ['total_transactions', 'live-tx-count', '']
+        ];
+        let liveElements = null;
+        const lastValues = {};
+        let pendingData = null;
+        let frameScheduled = false;
+        
         function updateStats(data) {
-            // Update latest block
-            const blockElement = document.getElementById('live-block-height');
-            if (blockElement && data.latest_block) {
-                blockElement.textContent = '#' + data.latest_block;
+            // Coalesce messages into at most one DOM update per frame
+            pendingData = data;
+            if (!frameScheduled) {
+                frameScheduled = true;
+                requestAnimationFrame(applyStats);
             }
-            
-            // Update total supply
-            const supplyElement = document.getElementById('live-total-supply');
-            if (supplyElement && data.total_supply_tmpl) {
-                supplyElement.textContent = data.total_supply_tmpl;
+        }
+        
+        function applyStats() {
+            frameScheduled = false;
+            const data = pendingData;
+            pendingData = null;
+            if (!data) {
+                return;
             }
-            
-            // Update validator count
-            const validatorElement = document.getElementById('live-validator-count');
-            if (validatorElement && data.validator_count) {
-                validatorElement.textContent = data.validator_count;
+            if (!liveElements) {
+                liveElements = LIVE_FIELDS.map(function(field) {
+                    return document.getElementById(field[1]);
+                });
             }
             
-            // Update transaction count
-            const txElement = document.getElementById('live-tx-count');
-            if (txElement && data.total_transactions) {
-                txElement.textContent = data.total_transactions;
-            }
+            LIVE_FIELDS.forEach(function(field, i) {
+                const element = liveElements[i];
+                const value = data[field[0]];
+                // Skip unchanged values so untouched nodes don't trigger style recalc
+                if (element && value && value !== lastValues[field[0]]) {
+                    element.textContent = field[2] + value;
+                    lastValues[field[0]] = value;
+                }
+            });
         }
         
         // Start live updates when page loads
         document.addEventListener('DOMContentLoaded', startLiveUpdates);
         
-        // Cleanup on page unload
-        window.addEventListener('beforeunload', function() {
-            if (eventSource) {
-                eventSource.close();
+        // Pause while the tab is in the background
+        document.addEventListener('visibilitychange', function() {
+            if (document.hidden) {
+                stopLiveUpdates();
+            } else {
+                reconnectDelay = 1000;
+                startLiveUpdates();
             }
         });
-    </script>
-    """
+        
+        // Cleanup on page unload
+        window.addEventListener('beforeunload', stopLiveUpdates);
+"""
 
-def get_navigation_html(active_page="home"):
-    """Get navigation bar HTML"""
-    pages = [
-        ("home", "/", "Home"),
-        ("blocks", "/blocks", "Blocks"),
-        ("transactions", "/transactions", "Transactions"),
-        ("send", "/send", "💸 Send"),
-        ("validators", "/validators-dashboard", "Validators"),
-        ("analytics", "/analytics", "Analytics"),
-        ("network", "/network", "Network"),
-        ("api", "/api-docs", "API")
-    ]
-    
+_NAV_PAGES = (
+    ("home", "/", "Home"),
+    ("blocks", "/blocks", "Blocks"),
+    ("transactions", "/transactions", "Transactions"),
+    ("send", "/send", "💸 Send"),
+    ("validators", "/validators-dashboard", "Validators"),
+    ("analytics", "/analytics", "Analytics"),
+    ("network", "/network", "Network"),
+    ("api", "/api-docs", "API")
+)
+
+def _build_navigation_html(active_page):
     nav_items = []
-    for page_id, url, title in pages:
+    for page_id, url, title in _NAV_PAGES:
         active_class = " class='active'" if page_id == active_page else ""
         nav_items.append(f'<a href="{url}"{active_class}>{title}</a>')
     
@@ -426,3 +550,31 @@ def get_navigation_html(active_page="home"):
         {' '.join(nav_items)}
     </div>
     """
+
+# One prebuilt bar per page; pages outside the menu (e.g. a transaction) highlight nothing
+NAV_HTML = {page_id: _build_navigation_html(page_id) for page_id, _, _ in _NAV_PAGES}
+NAV_HTML_NO_ACTIVE = _build_navigation_html(None)
+
+# The stylesheet and scripts are served as separate cacheable files (name -> (body, media type));
+# pages only reference them. URLs carry a content hash, so browsers can keep them forever.
+# Page-specific stylesheet kept as a plain file next to the other static files
+with open(os.path.join(os.path.dirname(__file__), "static", "send.css")) as _css_file:
+    _SEND_CSS = _css_file.read()
+
+STATIC_ASSETS = {
+    "explorer.css": (_minify_css(_BASE_CSS_TEMPLATE), "text/css"),
+    "send.css": (_minify_css(_SEND_CSS), "text/css"),
+    "theme.js": (_THEME_TOGGLE_JS, "application/javascript"),
+    "live-updates.js": (_LIVE_UPDATES_JS, "application/javascript"),
+}
+
+def asset_url(name):
+    """Get the versioned URL of a STATIC_ASSETS entry"""
+    version = hashlib.sha256(STATIC_ASSETS[name][0].encode()).hexdigest()[:12]
+    return f"/assets/{name}?v={version}"
+
+# <head> tags loading the files above, shared by every explorer page
+BASE_STYLES = f'<link rel="stylesheet" href="{asset_url("explorer.css")}">'
+THEME_TOGGLE_SCRIPT = f'<script src="{asset_url("theme.js")}"></script>'
+LIVE_UPDATES_SCRIPT = f'<script src="{asset_url("live-updates.js")}" defer></script>'
+SEND_STYLES = f'<link rel="stylesheet" href="{asset_url("send.css")}">'
@@ -78,10 +78,21 @@ class ForkChoice:
             get_balance_func: Optional function to get TMPL balance of an address
                              Required for 51% attack detection
         """
-        self.finality_checkpoints: dict[int, str] = {}  # height -> block_hash
+        self.finality_checkpoints = {}  # height -> block_hash (see property below)
         self.get_balance = get_balance_func  # Function to query balances
         self.chain_weight_cache: dict[str, int] = {}  # chain_hash -> weight (cache for performance)
     
+    @property
+    def finality_checkpoints(self) -> dict[int, str]:
+        """Finality checkpoints (height -> block_hash); add new ones via add_finality_checkpoint"""
+        return self._finality_checkpoints
+    
+    @finality_checkpoints.setter
+    def finality_checkpoints(self, checkpoints: dict[int, str]):
+        # Replacing the whole map (e.g. when loading from disk) recomputes the latest height
+        self._finality_checkpoints = checkpoints
+        self._latest_checkpoint_height = max(checkpoints, default=0)
+    
     def calculate_chain_weight(self, chain: List[Block]) -> int:
         """
         Calculate cumulative weight of a blockchain.
@@ -390,14 +401,13 @@ class ForkChoice:
         Cannot reorganize past checkpoints.
         """
         if height % self.FINALITY_CHECKPOINT_INTERVAL == 0:
-            self.finality_checkpoints[height] = block_hash
+            self._finality_checkpoints[height] = block_hash
+            self._latest_checkpoint_height = max(self._latest_checkpoint_height, height)
             print(f"✅ Finality checkpoint added at height {height}")
     
     def _get_latest_checkpoint_height(self) -> int:
-        """Get the height of the most recent finality checkpoint."""
-        if not self.finality_checkpoints:
-            return 0
-        return max(self.finality_checkpoints.keys())
+        """Get the height of the most recent finality checkpoint (tracked as they are added)."""
+        return self._latest_checkpoint_height
     
     def get_checkpoint_at_height(self, height: int) -> Optional[str]:
         """Get finality checkpoint hash at given height (if exists)."""
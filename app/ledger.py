@@ -2,7 +2,7 @@ import json
 import os
 import tempfile
 import time
-from typing import Dict, List, Optional, Union, Tuple, Set
+from typing import Dict, Iterable, List, Optional, Union, Tuple, Set
 from app.block import Block
 from app.transaction import Transaction
 from app.fork_choice import ForkChoice
@@ -129,6 +129,22 @@ class Ledger:
         # This ensures ONLY ONLINE NODES RECEIVE BLOCK REWARDS (TIMPAL policy)
         self._online_validators_callback = None
         
+        # Per-block lookup indexes, all extended together in one pass over the blocks appended
+        # since the last lookup (_sync_block_indexes), and rebuilt if the indexed tip was rolled back:
+        # - address_stats: per-address transfer aggregates (sent/received counts and pal totals)
+        # - block_hash_to_height / tx_hash_to_height: exact-match hash lookups
+        # - cumulative_supply[h]: running total of block rewards of blocks 0..h
+        # - last_proposed_by / last_reward_by: latest height each validator proposed a block /
+        #   received a reward allocation
+        self.address_stats: Dict[str, Dict[str, int]] = {}
+        self.block_hash_to_height: Dict[str, int] = {}
+        self.tx_hash_to_height: Dict[str, int] = {}
+        self.cumulative_supply: List[int] = []
+        self.last_proposed_by: Dict[str, int] = {}
+        self.last_reward_by: Dict[str, int] = {}
+        self._block_index_height: int = -1
+        self._block_index_tip: Optional[str] = None
+        
         os.makedirs(data_dir, exist_ok=True)
         
         if self.use_production_storage:
@@ -900,6 +916,99 @@ class Ledger:
     def get_block_count(self) -> int:
         return len(self.blocks)
     
+    @property
+    def head_height(self) -> int:
+        """Height of the chain tip (-1 when no blocks are loaded)"""
+        return len(self.blocks) - 1
+    
+    def get_address_stats(self, address: str) -> Dict[str, int]:
+        """
+        Get transfer aggregates for an address.
+        
+        Returns:
+            Dict with tx_count, sent_count, recv_count, total_sent_pals (amount + fee)
+            and total_recv_pals
+        """
+        self._sync_block_indexes()
+        stats = self.address_stats.get(address)
+        return dict(stats) if stats else self._address_stats_entry(None)
+    
+    def get_height_by_block_hash(self, block_hash: str) -> Optional[int]:
+        """Get the height of the block with this hash on the current chain (None if unknown)"""
+        self._sync_block_indexes()
+        return self.block_hash_to_height.get(block_hash)
+    
+    def get_tx_height(self, tx_hash: str) -> Optional[int]:
+        """Get the height of the block containing this transaction (None if unknown)"""
+        self._sync_block_indexes()
+        return self.tx_hash_to_height.get(tx_hash)
+    
+    def get_cumulative_supply(self) -> List[int]:
+        """Get the running total of block rewards (in pals) at every height of the current chain"""
+        self._sync_block_indexes()
+        return self.cumulative_supply
+    
+    def get_last_proposed(self, address: str) -> int:
+        """Get the height of the latest block proposed by a validator (-1 if none)"""
+        self._sync_block_indexes()
+        return self.last_proposed_by.get(address, -1)
+    
+    def get_last_reward_height(self, address: str) -> int:
+        """Get the height of the latest block that allocated a reward to an address (-1 if none)"""
+        self._sync_block_indexes()
+        return self.last_reward_by.get(address, -1)
+    
+    def _sync_block_indexes(self):
+        """Extend the per-block lookup indexes with blocks appended since the last lookup; rebuild them after a rollback"""
+        indexed = self._block_index_height
+        if indexed > self.head_height or (indexed >= 0 and self.blocks[indexed].block_hash != self._block_index_tip):
+            self.address_stats = {}
+            self.block_hash_to_height = {}
+            self.tx_hash_to_height = {}
+            self.cumulative_supply = []
+            self.last_proposed_by = {}
+            self.last_reward_by = {}
+            indexed = -1
+        
+        supply = self.cumulative_supply
+        total_supply = supply[-1] if supply else 0
+        for block in self.blocks[indexed + 1:]:
+            height = block.height
+            self.block_hash_to_height.setdefault(block.block_hash, height)
+            total_supply += block.reward
+            supply.append(total_supply)
+            self.last_proposed_by[block.proposer] = height
+            if block.reward_allocations:
+                for address in block.reward_allocations:
+                    self.last_reward_by[address] = height
+            
+            for tx in block.transactions:
+                self.tx_hash_to_height.setdefault(tx.tx_hash, height)
+                if tx.tx_type != "transfer":
+                    continue
+                sender_stats = self._address_stats_entry(tx.sender)
+                sender_stats["tx_count"] += 1
+                sender_stats["sent_count"] += 1
+                sender_stats["total_sent_pals"] += tx.amount + tx.fee
+                recipient_stats = self._address_stats_entry(tx.recipient)
+                if tx.recipient != tx.sender:
+                    recipient_stats["tx_count"] += 1
+                recipient_stats["recv_count"] += 1
+                recipient_stats["total_recv_pals"] += tx.amount
+        
+        if self.blocks:
+            self._block_index_height = self.head_height
+            self._block_index_tip = self.blocks[-1].block_hash
+    
+    def _address_stats_entry(self, address: Optional[str]) -> Dict[str, int]:
+        """Get (creating if needed) the aggregate entry for an address; None gives a detached zero entry"""
+        entry = self.address_stats.get(address) if address is not None else None
+        if entry is None:
+            entry = {"tx_count": 0, "sent_count": 0, "recv_count": 0, "total_sent_pals": 0, "total_recv_pals": 0}
+            if address is not None:
+                self.address_stats[address] = entry
+        return entry
+    
     def save_state(self, full_save: bool = False):
         """
         Save blockchain state to disk
@@ -2775,6 +2884,42 @@ class Ledger:
         active_validators = set(self.get_active_validators())
         actual_status = 'active' if address in active_validators else 'offline'
         
+        return self._validator_info_with_status(data, actual_status)
+    
+    def snapshot_validators(self, addresses: Optional[Iterable[str]] = None) -> Dict[str, Tuple[Dict, int]]:
+        """
+        Get validator info and balance for many validators in one sweep.
+        
+        Same info as get_validator_info(), but the live active set is computed once
+        for the whole batch instead of once per validator.
+        
+        Args:
+            addresses: Validators to include (default: every registered validator);
+                       unregistered addresses are skipped
+        
+        Returns:
+            Dict of address -> (info, balance)
+        """
+        registry = self.validator_registry
+        if addresses is None:
+            addresses = registry.keys()
+        active_validators = set(self.get_active_validators())
+        
+        snapshot = {}
+        for address in addresses:
+            data = registry.get(address)
+            if data is None:
+                continue
+            actual_status = 'active' if address in active_validators else 'offline'
+            snapshot[address] = (
+                self._validator_info_with_status(data, actual_status),
+                self.balances.get(address, 0)
+            )
+        return snapshot
+    
+    @staticmethod
+    def _validator_info_with_status(data: Union[str, Dict], actual_status: str) -> Dict:
+        """Normalize a validator_registry entry and attach its live status"""
         # Convert old format to new format for consistency
         if isinstance(data, str):
             return {
@@ -49,6 +49,8 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from ecdsa import SECP256k1, SigningKey
 
+from app.wallet_index import record_wallet_addresses
+
 
 WALLET_VERSION = 3
 TIMPAL_COIN_CODE = 4007
@@ -231,6 +233,11 @@ class MultiWallet:
         with open(tmp, "w") as f:
             json.dump(data, f, indent=2)
         os.replace(tmp, self.wallet_file)
+        record_wallet_addresses(
+            self.wallet_file,
+            data.get("version", WALLET_VERSION),
+            [a["address"] for v in data.get("vaults", []) for a in v.get("accounts", [])],
+        )
 
     def load(self, password: str, passphrase: str = "") -> None:
         if not self.exists():
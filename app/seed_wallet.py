@@ -18,6 +18,7 @@ from bip_utils import (
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from app.wallet_index import record_wallet_addresses
 
 
 WALLET_VERSION = 2
@@ -331,6 +332,11 @@ class SeedWallet:
         
         with open(self.wallet_file, 'w') as f:
             json.dump(wallet_data, f, indent=2)
+        record_wallet_addresses(
+            self.wallet_file,
+            WALLET_VERSION,
+            [acc_data["address"] for acc_data in self.accounts.values()]
+        )
     
     def _encrypt_data(self, data: str, password: str) -> tuple:
         """Encrypt arbitrary data (for imported keys)."""
@@ -0,0 +1,73 @@
+"""
+Wallet address index for TIMPAL - maps addresses to the wallet file holding them
+
+Each wallet directory can carry a wallets.index.json next to its wallet files:
+
+    {"tmpl...": {"file": "wallets.json", "version": 3}, ...}
+
+Wallets update it whenever they are saved, so tools that need the key for an
+address (e.g. the explorer's Send page) can open exactly one wallet file instead
+of scanning and parsing every wallet in the directory.
+"""
+
+import json
+import os
+from typing import Iterable, Optional, Tuple
+
+WALLET_INDEX_FILE = "wallets.index.json"
+
+
+def _index_path(wallet_dir: str) -> str:
+    return os.path.join(wallet_dir or ".", WALLET_INDEX_FILE)
+
+
+def _read_index(wallet_dir: str) -> dict:
+    try:
+        with open(_index_path(wallet_dir), "r") as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def record_wallet_addresses(wallet_path: str, version: int, addresses: Iterable[str]) -> None:
+    """
+    Record the addresses a wallet file holds in its directory's index.
+
+    Entries previously recorded for the same file are replaced. Failures are
+    ignored: the index is only a lookup shortcut, never the source of truth.
+    """
+    wallet_dir, wallet_file = os.path.split(wallet_path)
+    try:
+        index = {
+            address: entry
+            for address, entry in _read_index(wallet_dir).items()
+            if entry.get("file") != wallet_file
+        }
+        for address in addresses:
+            index[address] = {"file": wallet_file, "version": version}
+
+        path = _index_path(wallet_dir)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, path)
+    except (OSError, AttributeError):
+        pass
+
+
+def lookup_wallet(wallet_dir: str, address: str) -> Optional[Tuple[str, int]]:
+    """
+    Find the wallet file holding an address.
+
+    Returns:
+        Tuple of (wallet_path, version), or None if the address is not indexed
+        or the indexed file no longer exists
+    """
+    entry = _read_index(wallet_dir).get(address)
+    if not isinstance(entry, dict) or "file" not in entry:
+        return None
+    wallet_path = os.path.join(wallet_dir, entry["file"])
+    if not os.path.exists(wallet_path):
+        return None
+    return wallet_path, entry.get("version", 1)
@@ -509,24 +509,26 @@ class TestnetNode:
                     'message': 'Transaction processing failed. Please check your inputs and try again.'
                 }, status=500)
         
+        def transaction_from_dict(tx_data):
+            """Create Transaction object from a pre-signed transaction dict"""
+            return Transaction(
+                sender=tx_data['sender'],
+                recipient=tx_data['recipient'],
+                amount=tx_data['amount'],
+                fee=tx_data['fee'],
+                timestamp=tx_data['timestamp'],
+                nonce=tx_data['nonce'],
+                signature=tx_data.get('signature'),
+                public_key=tx_data.get('public_key'),
+                tx_type=tx_data.get('tx_type', 'transfer'),
+                device_id=tx_data.get('device_id')
+            )
+        
         async def submit_transaction(request):
             """Accept and submit a pre-signed transaction"""
             try:
                 tx_data = await request.json()
-                
-                # Create Transaction object from dict
-                tx = Transaction(
-                    sender=tx_data['sender'],
-                    recipient=tx_data['recipient'],
-                    amount=tx_data['amount'],
-                    fee=tx_data['fee'],
-                    timestamp=tx_data['timestamp'],
-                    nonce=tx_data['nonce'],
-                    signature=tx_data.get('signature'),
-                    public_key=tx_data.get('public_key'),
-                    tx_type=tx_data.get('tx_type', 'transfer'),
-                    device_id=tx_data.get('device_id')
-                )
+                tx = transaction_from_dict(tx_data)
                 
                 # Submit to node mempool
                 if self.node.submit_transaction(tx):
@@ -547,6 +549,56 @@ class TestnetNode:
                     'message': str(e)
                 }, status=500)
         
+        async def submit_transactions_batch(request):
+            """
+            Accept a JSON list of pre-signed transactions in one request.
+            Returns one result per transaction, in request order.
+            Max 100 transactions per request.
+            """
+            try:
+                tx_list = await request.json()
+                
+                if not isinstance(tx_list, list):
+                    return web.json_response({
+                        'status': 'error',
+                        'message': 'Expected a JSON list of transactions'
+                    }, status=400)
+                
+                if len(tx_list) > 100:
+                    return web.json_response({
+                        'status': 'error',
+                        'message': 'Max 100 transactions per request'
+                    }, status=400)
+                
+                results = []
+                for tx_data in tx_list:
+                    try:
+                        tx = transaction_from_dict(tx_data)
+                        if self.node.submit_transaction(tx):
+                            results.append({
+                                'status': 'success',
+                                'message': 'Transaction accepted',
+                                'tx_hash': tx.calculate_hash()
+                            })
+                        else:
+                            results.append({
+                                'status': 'error',
+                                'message': 'Transaction rejected'
+                            })
+                    except Exception as e:
+                        results.append({
+                            'status': 'error',
+                            'message': str(e)
+                        })
+                
+                return web.json_response({'results': results})
+                
+            except Exception as e:
+                return web.json_response({
+                    'status': 'error',
+                    'message': str(e)
+                }, status=500)
+        
         async def get_blocks_range(request):
             """
             HTTP API endpoint for batch block sync (Tendermint-style).
@@ -570,20 +622,22 @@ class TestnetNode:
                         'latest_height': 0
                     })
                 
-                # Ensure end doesn't exceed latest height
+                # Ensure end doesn't exceed latest height (and start doesn't go below genesis),
+                # then take the whole range with a single slice
                 end = min(end, latest_block.height)
+                start = max(start, 0)
                 
-                blocks = []
-                for height in range(start, end + 1):
-                    block = self.node.ledger.get_block_by_height(height)
-                    if block:
-                        blocks.append(block.to_dict())
+                blocks = [block.to_dict() for block in self.node.ledger.blocks[start:end + 1]] if end >= start else []
                 
-                return web.json_response({
+                # Block JSON repeats the same field names for every block and transaction;
+                # compress it for peers that accept it (aiohttp clients do by default)
+                response = web.json_response({
                     'blocks': blocks,
                     'latest_height': latest_block.height,
                     'count': len(blocks)
                 })
+                response.enable_compression()
+                return response
                 
             except Exception as e:
                 return web.json_response({
@@ -652,6 +706,7 @@ class TestnetNode:
         app = web.Application()
         app.router.add_post('/send', send_transaction)  # User-friendly endpoint
         app.router.add_post('/submit_transaction', submit_transaction)  # Pre-signed transactions
+        app.router.add_post('/submit_transactions_batch', submit_transactions_batch)  # Pre-signed transactions, batched
         app.router.add_get('/api/blocks/range', get_blocks_range)
         app.router.add_get('/api/blockchain/info', get_blockchain_info)
         app.router.add_get('/api/health', get_health)